@@ -342,6 +342,16 @@ class Logger:
 
         return {"origin_path": file, "origin_line": line, "origin_func": func_name}
 
+    def is_enabled_for(self, level: int) -> bool:
+        """
+        Checks if a message of the given level would actually be logged.
+
+        :param level:
+            The level to check.
+        """
+
+        return level >= self.min_level and self.authorized
+
     def single_logger_factory(level_name: str):  # pylint: disable=no-self-argument
         """
         Provides the general factory.
@@ -52,12 +52,43 @@ License:
 
 # pylint: disable=too-many-lines
 
+import asyncio
+import collections
+import concurrent.futures
 import json
+import logging
 import os
-from typing import Generator, List, Optional, Union
+import random
+import statistics
+import threading
+import time
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    FrozenSet,
+    Generator,
+    Hashable,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
+
+try:
+    import aiohttp
+except ImportError:  # pragma: no cover ## Optional dependency
+    aiohttp = None
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover ## Optional dependency
+    orjson = None
 
 import requests
 import requests.exceptions
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 import PyFunceble.facility
 import PyFunceble.storage
@@ -65,6 +96,197 @@ from PyFunceble.checker.availability.status import AvailabilityCheckerStatus
 from PyFunceble.checker.reputation.status import ReputationCheckerStatus
 from PyFunceble.checker.syntax.status import SyntaxCheckerStatus
 from PyFunceble.helpers.environment_variable import EnvironmentVariableHelper
+from PyFunceble.query.exceptions import PlatformCircuitOpen, PlatformResponseTooLarge
+
+_NET_EXC = (requests.RequestException, json.decoder.JSONDecodeError)
+
+# The key under which the request guessing the API flavor runs.
+_GUESS_KEY = ("guess", "is_modern_api")
+
+# The status we are able to push. They are not subclassed, so we can check
+# the exact type instead of walking the MRO through isinstance().
+_STATUS_TYPES = frozenset(
+    {AvailabilityCheckerStatus, SyntaxCheckerStatus, ReputationCheckerStatus}
+)
+
+# The environment variables we read our settings from - in order of priority.
+_ENV_VARS = {
+    x: (
+        EnvironmentVariableHelper(f"PYFUNCEBLE_COLLECTION_{x}"),
+        EnvironmentVariableHelper(f"PYFUNCEBLE_PLATFORM_{x}"),
+    )
+    for x in ("API_TOKEN", "API_URL", "POOL_SIZE", "CACHE_TTL", "CACHE_SIZE")
+}
+
+if orjson is not None:
+    _json_loads = orjson.loads
+    _json_dumps = orjson.dumps
+else:  # pragma: no cover ## Optional dependency
+    _json_loads = json.loads
+
+    def _json_dumps(data: Any) -> bytes:
+        """
+        Encodes the given data to JSON.
+        """
+
+        return json.dumps(data).encode("utf-8")
+
+
+class _TTLCache:
+    """
+    Provides a thread-safe in-memory cache. Entries expire after the given
+    amount of seconds and the least recently used ones are evicted first.
+
+    :param ttl:
+        The number of seconds an entry stays valid.
+
+    :param max_size:
+        The maximum number of entries to keep.
+    """
+
+    def __init__(self, ttl: float, max_size: int) -> None:
+        self.ttl = ttl
+        self.max_size = max_size
+
+        self._data: "collections.OrderedDict[Hashable, Tuple[float, Any]]" = (
+            collections.OrderedDict()
+        )
+        self._lock = threading.RLock()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """
+        Provides the (still valid) cached value of the given key or
+        :py:class:`None`.
+
+        :param key:
+            The key to look for.
+        """
+
+        with self._lock:
+            entry = self._data.get(key)
+
+            if entry is None:
+                return None
+
+            if time.monotonic() - entry[0] >= self.ttl:
+                del self._data[key]
+                return None
+
+            self._data.move_to_end(key)
+
+            return entry[1]
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """
+        Caches the given value.
+
+        :param key:
+            The key to store the value under.
+
+        :param value:
+            The value to store.
+        """
+
+        if self.ttl <= 0 or self.max_size <= 0:
+            return
+
+        with self._lock:
+            self._data[key] = (time.monotonic(), value)
+            self._data.move_to_end(key)
+
+            while len(self._data) > self.max_size:
+                self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        """
+        Removes all cached entries.
+        """
+
+        with self._lock:
+            self._data.clear()
+
+
+class _CircuitBreaker:
+    """
+    Provides a minimal (closed, open, half-open) circuit breaker.
+
+    After :code:`fail_threshold` consecutive failures, the circuit is opened
+    and all requests are refused during :code:`reset_timeout` seconds. Once
+    that delay is over, a single trial request is let through (half-open) and
+    its outcome decides whether the circuit is closed or opened again. The
+    other requests are refused meanwhile - unless the outcome of the trial
+    was not recorded within :code:`reset_timeout` seconds, in which case
+    another trial is let through.
+
+    :param fail_threshold:
+        The number of consecutive failures before opening the circuit.
+
+    :param reset_timeout:
+        The number of seconds to wait before trying again.
+    """
+
+    def __init__(self, fail_threshold: int = 5, reset_timeout: float = 30.0) -> None:
+        self.fail_threshold = fail_threshold
+        self.reset_timeout = reset_timeout
+
+        self.state = "closed"
+        self.failures = 0
+        self.opened_at = 0.0
+
+        self._lock = threading.Lock()
+
+    def allow(self) -> bool:
+        """
+        Checks if a request can be issued.
+        """
+
+        with self._lock:
+            if self.state == "closed":
+                return True
+
+            now = time.monotonic()
+
+            if now - self.opened_at < self.reset_timeout:
+                return False
+
+            # We let a single trial request through.
+            self.state = "half-open"
+            self.opened_at = now
+
+            return True
+
+    def record_success(self) -> None:
+        """
+        Records a successful request.
+        """
+
+        with self._lock:
+            self.state = "closed"
+            self.failures = 0
+
+    def record_failure(self) -> bool:
+        """
+        Records a failed request.
+
+        :return:
+            Whether the circuit was opened by this failure.
+        """
+
+        with self._lock:
+            self.failures += 1
+
+            if self.state == "half-open" or self.failures >= self.fail_threshold:
+                tripped = self.state != "open"
+
+                self.state = "open"
+                self.opened_at = time.monotonic()
+
+                return tripped
+
+            return False
 
 
 class PlatformQueryTool:
@@ -100,43 +322,45 @@ class PlatformQueryTool:
     STD_CHECKER_PRIORITY: str = ["none"]
     STD_CHECKER_EXCLUDE: str = ["none"]
     STD_TIMEOUT: float = 5.0
+    STD_POOL_SIZE: int = 32
+    STD_CACHE_TTL: float = 300.0
+    STD_CACHE_SIZE: int = 4096
+    MAX_RESPONSE_SIZE: int = 8 * 1024 * 1024
+
+    GUESS_METHODS: Tuple[str, ...] = (
+        "guess_and_set_preferred_status_origin",
+        "guess_and_set_checker_priority",
+        "guess_and_set_checker_exclude",
+        "guess_and_set_timeout",
+        "guess_and_set_is_modern_api",
+    )
 
-    _token: Optional[str] = None
-    """
-    The token to use while communicating with the platform API.
-    """
-
-    _url_base: Optional[str] = None
-    """
-    The base of the URL to communicate with.
-    """
-
-    _preferred_status_origin: Optional[str] = None
-    """
-    The preferred data origin
-    """
-
-    _checker_priority: Optional[List[str]] = []
-    """
-    The checker to prioritize.
-    """
-
-    _checker_exclude: Optional[List[str]] = []
-    """
-    The checker to exclude.
-    """
-
-    _is_modern_api: Optional[bool] = None
-    """
-    Whether we are working with the modern or legacy API.
-    """
-
-    _timeout: float = 5.0
-    """
-    The timeout to use while communicating with the API.
-    """
-
-    session: Optional[requests.Session] = None
+    __slots__ = {
+        "_token": "The token to use while communicating with the platform API.",
+        "_url_base": "The base of the URL to communicate with.",
+        "_preferred_status_origin": "The preferred data origin.",
+        "_checker_priority": "The checker to prioritize.",
+        "_checker_exclude": "The checker to exclude.",
+        "_is_modern_api": "Whether we are working with the modern or legacy API.",
+        "_timeout": "The timeout to use while communicating with the API.",
+        "session": "The session to use while communicating with the API.",
+        "_non_idempotent_session": (
+            "The session to use for the requests which can't be safely repeated."
+        ),
+        "_pull_cache": "The cache of the (successful) responses of the search.",
+        "_urls": "The (cached) URLs to communicate with.",
+        "_circuit_breakers": "The circuit breakers to use - per URL base.",
+        "_inflight": "The searches which are currently running.",
+        "_inflight_lock": "The lock protecting the running searches.",
+        "_ainflight": "The asynchronous searches which are currently running.",
+        "_aio_session": "The aiohttp session to use within the asynchronous API.",
+        "_aio_loop": "The loop the aiohttp session is bound to.",
+        "_metrics": "The counters and latencies exposed through stats().",
+        "_metrics_lock": "The lock protecting the metrics.",
+        # Keeps instance-level (monkey) patching - e.g. of pull() - possible.
+        # The dictionary is only allocated when it's actually used.
+        "__dict__": None,
+    }
 
     def __init__(
         self,
@@ -147,16 +371,21 @@ class PlatformQueryTool:
         checker_priority: Optional[List[str]] = None,
         checker_exclude: Optional[List[str]] = None,
     ) -> None:
+        self._token = None
+        self._url_base = None
+        self._preferred_status_origin = None
+        self._checker_priority = []
+        self._checker_exclude = []
+        self._is_modern_api = None
+        self._timeout = self.STD_TIMEOUT
+        self._urls = None
+        self._aio_session = None
+        self._aio_loop = None
+
         if token is not None:
             self.token = token
         else:
-            self.token = EnvironmentVariableHelper(
-                "PYFUNCEBLE_COLLECTION_API_TOKEN"
-            ).get_value(default="") or EnvironmentVariableHelper(
-                "PYFUNCEBLE_PLATFORM_API_TOKEN"
-            ).get_value(
-                default=""
-            )
+            self.token = self.__get_value_from_environment("API_TOKEN", "")
 
         if preferred_status_origin is not None:
             self.preferred_status_origin = preferred_status_origin
@@ -178,23 +407,387 @@ class PlatformQueryTool:
         else:
             self.guess_and_set_timeout()
 
-        self._url_base = EnvironmentVariableHelper(
-            "PYFUNCEBLE_COLLECTION_API_URL"
-        ).get_value(default=None) or EnvironmentVariableHelper(
-            "PYFUNCEBLE_PLATFORM_API_URL"
-        ).get_value(
-            default=None
+        self._url_base = self.__get_value_from_environment("API_URL", None)
+
+        self._circuit_breakers = {}
+        self._metrics = {
+            "hits": 0,
+            "misses": 0,
+            "coalesced": 0,
+            "requests": 0,
+            "errors": 0,
+            "5xx": 0,
+            "trips": 0,
+            "latency": collections.deque(maxlen=1024),
+        }
+        self._metrics_lock = threading.Lock()
+        self._inflight = {}
+        self._inflight_lock = threading.Lock()
+        self._ainflight = {}
+
+        pool_size = self.__get_number_from_environment(
+            "POOL_SIZE", self.STD_POOL_SIZE, int
+        )
+
+        self._pull_cache = _TTLCache(
+            self.__get_number_from_environment("CACHE_TTL", self.STD_CACHE_TTL, float),
+            self.__get_number_from_environment("CACHE_SIZE", self.STD_CACHE_SIZE, int),
+        )
+
+        self.session = self.__build_session(pool_size, frozenset(["GET", "POST"]))
+        # Only the connection errors are retried for POSTs sent through this
+        # one - it's fine: nothing was sent yet.
+        self._non_idempotent_session = self.__build_session(
+            pool_size, frozenset(["GET"])
         )
 
-        self.session = requests.Session()
-        self.session.headers.update(
-            {
-                "Authorization": f"Bearer {self.token}" if self.token else None,
-                "X-Pyfunceble-Version": PyFunceble.storage.PROJECT_VERSION,
-                "Content-Type": "application/json",
+        # The Accept-Encoding header is left to requests: it only advertises
+        # the encodings (e.g. br) urllib3 is able to decode.
+        headers = {
+            "X-Pyfunceble-Version": PyFunceble.storage.PROJECT_VERSION,
+            "Content-Type": "application/json",
+            "Accept": "application/json",
+        }
+
+        if self.token:
+            headers["Authorization"] = f"Bearer {self.token}"
+
+        self.session.headers.update(headers)
+        self._non_idempotent_session.headers.update(headers)
+
+    def __getstate__(self) -> Dict[str, Any]:
+        """
+        Provides the state to pickle - e.g. when the tool is shipped to a
+        worker started through :code:`spawn`.
+
+        The locks, the cache, the running searches, the circuit breakers and
+        the aiohttp session are process-local: they are rebuilt by
+        :meth:`__setstate__`.
+        """
+
+        transient = {
+            "_pull_cache",
+            "_circuit_breakers",
+            "_inflight",
+            "_inflight_lock",
+            "_ainflight",
+            "_aio_session",
+            "_aio_loop",
+            "_metrics_lock",
+        }
+
+        state = {
+            x: getattr(self, x)
+            for x in self.__slots__
+            if x != "__dict__" and x not in transient and hasattr(self, x)
+        }
+        state["__dict__"] = dict(getattr(self, "__dict__", {}))
+        state["_pull_cache"] = (self._pull_cache.ttl, self._pull_cache.max_size)
+
+        with self._metrics_lock:
+            state["_metrics"] = {
+                x: (
+                    collections.deque(y, maxlen=y.maxlen)
+                    if isinstance(y, collections.deque)
+                    else y
+                )
+                for x, y in self._metrics.items()
             }
+
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        """
+        Restores the state provided by :meth:`__getstate__`.
+        """
+
+        state = dict(state)
+
+        vars(self).update(state.pop("__dict__", {}))
+        self._pull_cache = _TTLCache(*state.pop("_pull_cache"))
+
+        for key, value in state.items():
+            setattr(self, key, value)
+
+        self._circuit_breakers = {}
+        self._inflight = {}
+        self._inflight_lock = threading.Lock()
+        self._ainflight = {}
+        self._aio_session = None
+        self._aio_loop = None
+        self._metrics_lock = threading.Lock()
+
+    @staticmethod
+    def __build_session(
+        pool_size: int, retry_methods: FrozenSet[str]
+    ) -> requests.Session:
+        """
+        Builds a session which retries the transient failures.
+
+        :param pool_size:
+            The number of connections to keep (per host).
+        :param retry_methods:
+            The HTTP methods we retry on a read error or a 5xx/429 response.
+        """
+
+        retries = Retry(
+            total=3,
+            backoff_factor=0.3,
+            status_forcelist=(429, 500, 502, 503, 504),
+            allowed_methods=retry_methods,
+            raise_on_status=False,
+            # The server could make us sleep for hours. Our backoff already
+            # paces the retries.
+            respect_retry_after_header=False,
+        )
+        adapter = HTTPAdapter(
+            pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retries
+        )
+
+        session = requests.Session()
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+
+        return session
+
+    @staticmethod
+    def __get_value_from_environment(name: str, default: Any) -> Any:
+        """
+        Provides the (non-empty) value of the
+        :code:`PYFUNCEBLE_COLLECTION_<name>` or
+        :code:`PYFUNCEBLE_PLATFORM_<name>` environment variable.
+
+        :param name:
+            The name of the setting.
+        :param default:
+            The value to provide when none is given.
+        """
+
+        collection_var, platform_var = _ENV_VARS[name]
+
+        return collection_var.get_value(default="") or platform_var.get_value(
+            default=default
         )
 
+    @staticmethod
+    def __get_number_from_environment(
+        name: str, default: Union[int, float], cast: type
+    ) -> Union[int, float]:
+        """
+        Provides the value of the :code:`PYFUNCEBLE_COLLECTION_<name>` or
+        :code:`PYFUNCEBLE_PLATFORM_<name>` environment variable.
+
+        :param name:
+            The name of the setting.
+        :param default:
+            The value to provide when none (or an invalid one) is given.
+        :param cast:
+            The type to convert the value to.
+        """
+
+        try:
+            return cast(PlatformQueryTool.__get_value_from_environment(name, default))
+        except ValueError:
+            return default
+
+    def _get_circuit_breaker(self) -> _CircuitBreaker:
+        """
+        Provides the circuit breaker of the current URL base.
+        """
+
+        url_base = self.url_base
+
+        try:
+            return self._circuit_breakers[url_base]
+        except KeyError:
+            return self._circuit_breakers.setdefault(url_base, _CircuitBreaker())
+
+    def _request(
+        self, method: str, url: str, *, idempotent: bool = True, **kwargs
+    ) -> requests.Response:
+        """
+        Issues a request through our session - unless the circuit of the
+        current URL base is open.
+
+        :param method:
+            The HTTP method to use.
+        :param url:
+            The URL to request.
+        :param idempotent:
+            Whether the request can safely be repeated. When it can't, our
+            session won't retry it on a read error or a 5xx response.
+
+        :raise PlatformCircuitOpen:
+            When the circuit is open.
+        """
+
+        circuit_breaker = self._get_circuit_breaker()
+
+        if not circuit_breaker.allow():
+            raise PlatformCircuitOpen(f"Circuit open for {self.url_base}.")
+
+        # Once per logical request: the retries of our session happen below.
+        self.__count("requests")
+
+        try:
+            session = self.session if idempotent else self._non_idempotent_session
+            response = getattr(session, method.lower())(url, **kwargs)
+        except requests.RequestException:
+            self.__count("errors")
+
+            if circuit_breaker.record_failure():
+                self.__count("trips")
+            raise
+
+        if response.status_code >= 500:
+            self.__count("5xx")
+
+            if circuit_breaker.record_failure():
+                self.__count("trips")
+        else:
+            circuit_breaker.record_success()
+
+        return response
+
+    def _read_content(self, response: requests.Response) -> bytes:
+        """
+        Reads the body of the given (streamed) response, refusing to read
+        more than :code:`MAX_RESPONSE_SIZE` bytes.
+
+        :param response:
+            The response to read.
+
+        :raise PlatformResponseTooLarge:
+            When the body is larger than :code:`MAX_RESPONSE_SIZE`.
+        """
+
+        try:
+            content_length = response.headers.get("Content-Length", "")
+
+            if (
+                content_length.isdigit()
+                and int(content_length) > self.MAX_RESPONSE_SIZE
+            ):
+                raise PlatformResponseTooLarge(
+                    f"Response of {response.url} too large ({content_length} bytes)."
+                )
+
+            buffer = bytearray()
+
+            for chunk in response.iter_content(65536):
+                buffer += chunk
+
+                if len(buffer) > self.MAX_RESPONSE_SIZE:
+                    raise PlatformResponseTooLarge(
+                        f"Response of {response.url} too large "
+                        f"(more than {self.MAX_RESPONSE_SIZE} bytes)."
+                    )
+
+            return bytes(buffer)
+        finally:
+            response.close()
+
+    async def _aread_content(self, response: "aiohttp.ClientResponse") -> bytes:
+        """
+        Reads the body of the given (aiohttp) response, refusing to read more
+        than :code:`MAX_RESPONSE_SIZE` bytes.
+
+        :param response:
+            The response to read.
+
+        :raise PlatformResponseTooLarge:
+            When the body is larger than :code:`MAX_RESPONSE_SIZE`.
+        """
+
+        if (
+            response.content_length is not None
+            and response.content_length > self.MAX_RESPONSE_SIZE
+        ):
+            raise PlatformResponseTooLarge(
+                f"Response of {response.url} too large "
+                f"({response.content_length} bytes)."
+            )
+
+        buffer = bytearray()
+
+        while True:
+            chunk = await response.content.read(
+                self.MAX_RESPONSE_SIZE + 1 - len(buffer)
+            )
+
+            if not chunk:
+                break
+
+            buffer += chunk
+
+            if len(buffer) > self.MAX_RESPONSE_SIZE:
+                raise PlatformResponseTooLarge(
+                    f"Response of {response.url} too large "
+                    f"(more than {self.MAX_RESPONSE_SIZE} bytes)."
+                )
+
+        return bytes(buffer)
+
+    def _retry_post(
+        self,
+        url: str,
+        *,
+        max_attempts: int = 3,
+        base: float = 0.2,
+        cap: float = 5.0,
+        **kwargs,
+    ) -> Tuple[requests.Response, Any]:
+        """
+        Posts to the given URL and decodes the JSON response.
+
+        Connection errors and 5xx responses are already retried by the
+        adapter of our session. This method takes care of the truncated or
+        undecodable successful (or 408) responses, retrying them with a
+        capped exponential backoff (with full jitter). An undecodable 5xx or
+        429 response is not retried again.
+
+        The response is streamed and its size capped. See
+        :meth:`_read_content`.
+
+        .. warning::
+            Only use it for requests that can safely be repeated.
+
+        :param url:
+            The URL to post to.
+        :param max_attempts:
+            The maximum number of attempts.
+        :param base:
+            The base delay (in seconds) of the backoff.
+        :param cap:
+            The maximum delay (in seconds) between two attempts.
+
+        :return:
+            The response and its decoded content.
+        """
+
+        for attempt in range(1, max_attempts + 1):
+            response = None
+
+            try:
+                response = self._request("POST", url, stream=True, **kwargs)
+
+                return response, _json_loads(self._read_content(response))
+            except (
+                requests.exceptions.ChunkedEncodingError,
+                requests.exceptions.ContentDecodingError,
+                json.decoder.JSONDecodeError,
+            ):
+                if attempt >= max_attempts or (
+                    response is not None
+                    and not 200 <= response.status_code < 300
+                    and response.status_code != 408
+                ):
+                    raise
+
+            time.sleep(random.uniform(0, min(cap, base * 2 ** (attempt - 1))))
+
+        raise RuntimeError("<max_attempts> should be greater than 0.")
+
     def __contains__(self, value: str) -> bool:
         """
         Checks if the given value is in the platform.
@@ -239,6 +832,7 @@ class PlatformQueryTool:
             raise TypeError(f"<value> should be {str}, {type(value)} given.")
 
         self._token = value
+        self._urls = None
 
     def set_token(self, value: str) -> "PlatformQueryTool":
         """
@@ -283,6 +877,7 @@ class PlatformQueryTool:
             )
 
         self._url_base = value.rstrip("/")
+        self._urls = None
 
     def set_url_base(self, value: str) -> "PlatformQueryTool":
         """
@@ -320,6 +915,7 @@ class PlatformQueryTool:
             raise TypeError(f"<value> should be {bool}, {type(value)} given.")
 
         self._is_modern_api = value
+        self._urls = None
 
     def set_is_modern_api(self, value: bool) -> "PlatformQueryTool":
         """
@@ -377,7 +973,8 @@ class PlatformQueryTool:
 
         if self.token:
             try:
-                response = self.session.get(
+                response = self._request(
+                    "GET",
                     f"{self.url_base}/v1/stats/subject",
                     timeout=self.timeout,
                 )
@@ -385,7 +982,7 @@ class PlatformQueryTool:
                 response.raise_for_status()
 
                 self.is_modern_api = False
-            except (requests.RequestException, json.decoder.JSONDecodeError):
+            except _NET_EXC:
                 self.is_modern_api = True
         else:
             self.is_modern_api = False
@@ -606,21 +1203,57 @@ class PlatformQueryTool:
 
         return self
 
-    def ensure_modern_api(func):  # pylint: disable=no-self-argument
+    def _get_urls(self) -> Dict[str, str]:
         """
-        Ensures that the :code:`is_modern_api` attribute is set before running
-        the decorated method.
+        Provides the URLs to communicate with. They are computed once per
+        combination of URL base, token and API flavor.
         """
 
-        def wrapper(self, *args, **kwargs):
-            if self.is_modern_api is None:
-                self.guess_and_set_is_modern_api()
+        if self._urls is not None:
+            return self._urls
+
+        urls = self.__build_urls(bool(self.is_modern_api))
+
+        if self.is_modern_api is not None:
+            self._urls = urls
+
+        return urls
+
+    def __build_urls(self, is_modern_api: bool) -> Dict[str, str]:
+        """
+        Builds the URLs to communicate with.
+
+        :param is_modern_api:
+            Whether we build the URLs of the modern or legacy API.
+        """
+
+        urls = {"whois": f"{self.url_base}/v1/status/whois"}
 
-            return func(self, *args, **kwargs)  # pylint: disable=not-callable
+        if is_modern_api:
+            if self.token:
+                urls["pull"] = f"{self.url_base}/v1/aggregation/subject/search"
+            else:
+                urls["pull"] = f"{self.url_base}/v1/hub/aggregation/subject/search"
+        else:
+            urls["pull"] = f"{self.url_base}/v1/subject/search"
+
+        for checker_type in self.SUPPORTED_CHECKERS:
+            if is_modern_api:
+                if not self.token:
+                    urls[f"push_{checker_type}"] = (
+                        f"{self.url_base}/v1/hub/status/{checker_type}"
+                    )
+                else:
+                    urls[f"push_{checker_type}"] = (
+                        f"{self.url_base}/v1/contracts/self-delivery"
+                    )
+            else:
+                urls[f"push_{checker_type}"] = (
+                    f"{self.url_base}/v1/status/{checker_type}"
+                )
 
-        return wrapper
+        return urls
 
-    @ensure_modern_api
     def pull(self, subject: str) -> Optional[dict]:
         """
         Pulls all data related to the subject or :py:class:`None`
@@ -635,57 +1268,480 @@ class PlatformQueryTool:
             The response of the search.
         """
 
-        PyFunceble.facility.Logger.info("Starting to search subject: %r", subject)
+        logger = PyFunceble.facility.Logger
+        log_info = logger.is_enabled_for(logging.INFO)
+
+        if log_info:
+            logger.info("Starting to search subject: %r", subject)
 
         if not isinstance(subject, str):
             raise TypeError(f"<subject> should be {str}, {type(subject)} given.")
 
-        if self.is_modern_api:
-            if self.token:
-                url = f"{self.url_base}/v1/aggregation/subject/search"
-            else:
-                url = f"{self.url_base}/v1/hub/aggregation/subject/search"
-        else:
-            url = f"{self.url_base}/v1/subject/search"
+        if self.is_modern_api is None and not self.token:
+            # No request involved.
+            self.guess_and_set_is_modern_api()
 
-        try:
-            response = self.session.post(
-                url,
-                json={"subject": subject},
-                timeout=self.timeout,
+        if self.is_modern_api is None:
+            # The API flavor is guessed through the first search. The other
+            # searches wait for it.
+            is_owner, response_json = self.__coalesce(
+                _GUESS_KEY, self.__search_and_guess_is_modern_api, subject
             )
 
-            response_json = response.json()
+            if not is_owner:
+                return self.pull(subject)
 
-            if response.status_code == 200:
-                PyFunceble.facility.Logger.debug(
-                    "Successfully search subject: %r. Response: %r",
-                    subject,
-                    response_json,
-                )
+            self.__count("misses")
 
-                PyFunceble.facility.Logger.info(
-                    "Finished to search subject: %r", subject
-                )
+            if log_info:
+                logger.info("Finished to search subject: %r", subject)
 
-                return response_json
-        except (requests.RequestException, json.decoder.JSONDecodeError):
-            response_json = {}
+            return response_json
 
-        PyFunceble.facility.Logger.debug(
-            "Failed to search subject: %r. Response: %r", subject, response_json
-        )
-        PyFunceble.facility.Logger.info("Finished to search subject: %r", subject)
+        url = self._get_urls()["pull"]
+        response_json = self._pull_cache.get((url, subject))
 
-        return None
+        if response_json is not None:
+            self.__count("hits")
 
-    @ensure_modern_api
-    def pull_contract(self, amount: int = 1) -> Generator[dict, None, None]:
-        """
-        Pulls the next amount of contracts.
+            if log_info:
+                logger.info("Finished to search subject: %r (cached)", subject)
 
-        :param int amount:
-            The amount of data to pull.
+            return response_json
+
+        self.__count("misses")
+
+        is_owner, response_json = self.__coalesce(
+            (url, subject), self.__search, url, subject
+        )
+
+        if not is_owner:
+            # Another thread was already searching for the same subject.
+            self.__count("coalesced")
+
+            if log_info:
+                logger.info("Finished to search subject: %r (coalesced)", subject)
+
+            return response_json
+
+        if log_info:
+            logger.info("Finished to search subject: %r", subject)
+
+        return response_json
+
+    def __coalesce(
+        self, key: Hashable, func: Callable[..., Any], *args
+    ) -> Tuple[bool, Any]:
+        """
+        Runs the given function - unless another thread is already running
+        something under the same key. In which case we wait for it and
+        provide its result.
+
+        :param key:
+            The key identifying what we run.
+        :param func:
+            The function to run.
+
+        :return:
+            Whether we ran the function ourselves and its result.
+        """
+
+        with self._inflight_lock:
+            future = self._inflight.get(key)
+            is_owner = future is None
+
+            if is_owner:
+                future = concurrent.futures.Future()
+                self._inflight[key] = future
+
+        if not is_owner:
+            return False, future.result()
+
+        result = None
+
+        try:
+            result = func(*args)
+        finally:
+            with self._inflight_lock:
+                del self._inflight[key]
+
+            future.set_result(result)
+
+        return True, result
+
+    @staticmethod
+    def __is_idempotent(url: str) -> bool:
+        """
+        Checks whether a POST to the given URL can safely be repeated.
+
+        A contract delivery - even a self-delivery - can't: the platform
+        would record it twice.
+
+        :param url:
+            The URL to check.
+        """
+
+        return "/v1/contracts/" not in url
+
+    @staticmethod
+    def __is_unknown_route(response: requests.Response, content: bytes) -> bool:
+        """
+        Checks whether the given response tells us that the route we posted
+        to doesn't exist.
+
+        :param response:
+            The response to check.
+        :param content:
+            The body of the response.
+        """
+
+        if response.status_code == 405:
+            return True
+
+        if response.status_code != 404:
+            return False
+
+        try:
+            content_json = _json_loads(content)
+        except json.decoder.JSONDecodeError:
+            return True
+
+        # The platform tells us why it didn't find the subject. An unknown
+        # route only gets the generic answer of the framework (or proxy).
+        return not isinstance(content_json, dict) or content_json.get("detail") in (
+            None,
+            "Not Found",
+        )
+
+    def __post_and_guess_is_modern_api(
+        self, url_name: str, data: Any, timeout: float
+    ) -> Tuple[Optional[requests.Response], bytes]:
+        """
+        Posts the given data to the modern flavor of the given URL - then to
+        the legacy one if it doesn't exist - and guesses whether we are working
+        with the modern or legacy API from the answers.
+
+        When both flavors answer that they don't know what we are talking
+        about, we can't decide and fall back to
+        :meth:`guess_and_set_is_modern_api`.
+
+        :param url_name:
+            The name of the URL - as provided by :meth:`_get_urls`.
+        :param data:
+            The data to post.
+        :param timeout:
+            The timeout of the request(s).
+
+        :return:
+            The response and its body. The response is :py:class:`None` when
+            none is worth reading.
+        """
+
+        for is_modern_api in (True, False):
+            url = self.__build_urls(is_modern_api)[url_name]
+            response = self._request(
+                "POST",
+                url,
+                data=data,
+                timeout=timeout,
+                idempotent=self.__is_idempotent(url),
+                stream=True,
+            )
+            content = self._read_content(response)
+
+            if not self.__is_unknown_route(response, content):
+                break
+        else:
+            self.guess_and_set_is_modern_api()
+
+            return None, b""
+
+        if 200 <= response.status_code < 300 or response.status_code == 404:
+            self.is_modern_api = is_modern_api
+
+        return response, content
+
+    def __search_and_guess_is_modern_api(self, subject: str) -> Optional[dict]:
+        """
+        Searches for the given subject while guessing whether we are working
+        with the modern or legacy API - instead of probing it through a
+        dedicated request.
+
+        :param subject:
+            The subject to search for.
+        """
+
+        started_at = time.perf_counter()
+
+        try:
+            response, content = self.__post_and_guess_is_modern_api(
+                "pull", _json_dumps({"subject": subject}), self.timeout
+            )
+
+            if response is not None and response.status_code == 200:
+                response_json = _json_loads(content)
+
+                self._pull_cache.set((self._get_urls()["pull"], subject), response_json)
+
+                return response_json
+        except _NET_EXC:
+            pass
+        finally:
+            self.__record_latency(started_at)
+
+        return None
+
+    def __search(self, url: str, subject: str) -> Optional[dict]:
+        """
+        Searches for the given subject.
+
+        :param url:
+            The URL of the search endpoint.
+        :param subject:
+            The subject to search for.
+        """
+
+        logger = PyFunceble.facility.Logger
+        log_debug = logger.is_enabled_for(logging.DEBUG)
+
+        started_at = time.perf_counter()
+
+        try:
+            response, response_json = self._retry_post(
+                url,
+                data=_json_dumps({"subject": subject}),
+                timeout=self.timeout,
+            )
+
+            if response.status_code == 200:
+                if log_debug:
+                    logger.debug(
+                        "Successfully search subject: %r. Response: %r",
+                        subject,
+                        response_json,
+                    )
+
+                self._pull_cache.set((url, subject), response_json)
+
+                return response_json
+        except _NET_EXC:
+            response_json = {}
+        finally:
+            self.__record_latency(started_at)
+
+        if log_debug:
+            logger.debug(
+                "Failed to search subject: %r. Response: %r", subject, response_json
+            )
+
+        return None
+
+    def pull_batch(self, subjects: List[str]) -> Dict[str, Optional[dict]]:
+        """
+        Pulls all data related to the given subjects through a single request.
+
+        When the platform does not support batch searches, we fall back to
+        :meth:`pull_many` (or :meth:`pull` when :code:`aiohttp` is not
+        installed or when we are called from a running event loop).
+
+        :param subjects:
+            The subjects to search for.
+
+        :raise TypeError:
+            When one of the given :code:`subjects` is not a :py:class:`str`.
+
+        :return:
+            The response of the search of each subject.
+        """
+
+        for subject in subjects:
+            if not isinstance(subject, str):
+                raise TypeError(f"<subject> should be {str}, {type(subject)} given.")
+
+        PyFunceble.facility.Logger.info(
+            "Starting to search %d subjects (batch).", len(subjects)
+        )
+
+        if self.is_modern_api is None and not self.token:
+            # No request involved.
+            self.guess_and_set_is_modern_api()
+
+        if self.is_modern_api is None and subjects:
+            # The API flavor is guessed through a first (single) search. Its
+            # result is cached.
+            self.pull(subjects[0])
+
+        pull_url = self._get_urls()["pull"]
+        result = {x: self._pull_cache.get((pull_url, x)) for x in subjects}
+        missing = [x for x, y in result.items() if y is None]
+
+        self.__count("hits", len(subjects) - len(missing))
+
+        if not missing:
+            PyFunceble.facility.Logger.info(
+                "Finished to search %d subjects (batch, cached).", len(subjects)
+            )
+
+            return result
+
+        url = f"{pull_url}/batch"
+
+        try:
+            response = self._request(
+                "POST",
+                url,
+                data=_json_dumps({"subjects": missing}),
+                timeout=self.timeout * 10,
+                stream=True,
+            )
+
+            if response.status_code in (404, 405, 415):
+                response.close()
+
+                PyFunceble.facility.Logger.debug(
+                    "Batch search not supported by %s. Falling back.", url
+                )
+
+                result.update(self.__pull_batch_fallback(missing))
+
+                PyFunceble.facility.Logger.info(
+                    "Finished to search %d subjects (batch).", len(subjects)
+                )
+
+                return result
+
+            # The searches of the fallback are accounted by pull() / apull().
+            self.__count("misses", len(missing))
+
+            response_json = _json_loads(self._read_content(response))
+
+            if response.status_code == 200:
+                if isinstance(response_json, list):
+                    response_json = {
+                        x["subject"]: x
+                        for x in response_json
+                        if isinstance(x, dict) and "subject" in x
+                    }
+
+                if isinstance(response_json, dict):
+                    for subject in missing:
+                        if response_json.get(subject) is not None:
+                            result[subject] = response_json[subject]
+                            self._pull_cache.set((pull_url, subject), result[subject])
+
+                PyFunceble.facility.Logger.debug(
+                    "Successfully searched subjects: %r. Response: %r",
+                    missing,
+                    response_json,
+                )
+        except _NET_EXC:
+            PyFunceble.facility.Logger.debug("Failed to search subjects: %r", missing)
+
+        PyFunceble.facility.Logger.info(
+            "Finished to search %d subjects (batch).", len(subjects)
+        )
+
+        return result
+
+    def __pull_batch_fallback(self, subjects: List[str]) -> Dict[str, Optional[dict]]:
+        """
+        Searches the given subjects one by one - concurrently when possible.
+
+        :param subjects:
+            The subjects to search for.
+        """
+
+        if aiohttp is not None:
+            try:
+                asyncio.get_running_loop()
+            except RuntimeError:
+
+                return dict(zip(subjects, asyncio.run(self.pull_many(subjects))))
+
+        # We can't start a loop from within a running one.
+        return {x: self.pull(x) for x in subjects}
+
+    def clear_pull_cache(self) -> "PlatformQueryTool":
+        """
+        Removes all the responses cached by :meth:`pull`.
+        """
+
+        self._pull_cache.clear()
+
+        return self
+
+    def __count(self, name: str, amount: int = 1) -> None:
+        """
+        Increments the given counter of our metrics.
+
+        :param name:
+            The name of the counter.
+        :param amount:
+            The amount to add.
+        """
+
+        with self._metrics_lock:
+            self._metrics[name] += amount
+
+    def __record_latency(self, started_at: float) -> None:
+        """
+        Records the latency of a request - successful or not.
+
+        :param started_at:
+            The value of :py:func:`time.perf_counter` when it started.
+        """
+
+        latency = time.perf_counter() - started_at
+
+        with self._metrics_lock:
+            self._metrics["latency"].append(latency)
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Provides what we observed while communicating with the platform.
+
+        The counters are:
+
+            - :code:`hits`: the searches served by the cache.
+            - :code:`misses`: the searches not served by the cache.
+            - :code:`coalesced`: the (missed) searches served by an identical
+              and already running search.
+            - :code:`requests`: the logical requests we made.
+            - :code:`errors`: the (logical) requests which failed without a
+              response - e.g. timeouts or connection errors.
+            - :code:`5xx`: the (logical) requests answered with a server
+              error.
+            - :code:`trips`: the number of times a circuit was opened.
+
+        A logical request is counted once - no matter how many times our
+        session retried it on the wire.
+
+        The latencies (in seconds) of the latest searches and submissions -
+        successful or not - are summarized through :code:`latency_p50` and
+        :code:`latency_p95` - :py:class:`None` while less than 2 of them were
+        observed.
+        """
+
+        with self._metrics_lock:
+            result = {x: y for x, y in self._metrics.items() if x != "latency"}
+            latencies = list(self._metrics["latency"])
+
+        if len(latencies) >= 2:
+            quantiles = statistics.quantiles(latencies, n=20, method="inclusive")
+
+            result["latency_p50"] = quantiles[9]
+            result["latency_p95"] = quantiles[18]
+        else:
+            result["latency_p50"] = result["latency_p95"] = None
+
+        return result
+
+    def pull_contract(self, amount: int = 1) -> Generator[dict, None, None]:
+        """
+        Pulls the next amount of contracts.
+
+        :param int amount:
+            The amount of data to pull.
 
         :return:
             The response of the query.
@@ -711,13 +1767,15 @@ class PlatformQueryTool:
             params["checker_type_exclude"] = ",".join(self.checker_exclude)
 
         try:
-            response = self.session.get(
+            response = self._request(
+                "GET",
                 url,
                 params=params,
                 timeout=self.timeout * 10,
+                stream=True,
             )
 
-            response_json = response.json()
+            response_json = _json_loads(self._read_content(response))
 
             if response.status_code == 200:
                 PyFunceble.facility.Logger.debug(
@@ -729,7 +1787,7 @@ class PlatformQueryTool:
                 yield response_json
             else:
                 response_json = []
-        except (requests.RequestException, json.decoder.JSONDecodeError):
+        except _NET_EXC:
             response_json = []
 
         PyFunceble.facility.Logger.debug(
@@ -739,7 +1797,6 @@ class PlatformQueryTool:
 
         yield response_json
 
-    @ensure_modern_api
     def deliver_contract(self, contract: dict, contract_data: dict) -> Optional[dict]:
         """
         Delivers the given contract data.
@@ -766,13 +1823,16 @@ class PlatformQueryTool:
         url = f"{self.url_base}/v1/contracts/{contract_id}/delivery"
 
         try:
-            response = self.session.post(
+            response = self._request(
+                "POST",
                 url,
                 data=contract_data.encode("utf-8"),
                 timeout=self.timeout * 10,
+                idempotent=False,
+                stream=True,
             )
 
-            response_json = response.json()
+            response_json = _json_loads(self._read_content(response))
 
             if response.status_code == 200:
                 PyFunceble.facility.Logger.debug(
@@ -786,7 +1846,7 @@ class PlatformQueryTool:
                 )
 
                 return response_json
-        except (requests.RequestException, json.decoder.JSONDecodeError):
+        except _NET_EXC:
             response_json = {}
 
         PyFunceble.facility.Logger.debug(
@@ -798,7 +1858,6 @@ class PlatformQueryTool:
 
         return None
 
-    @ensure_modern_api
     def push(
         self,
         checker_status: Union[
@@ -824,10 +1883,70 @@ class PlatformQueryTool:
             When the given :code:`checker_status.subject` is empty.
         """
 
-        if not isinstance(
-            checker_status,
-            (AvailabilityCheckerStatus, SyntaxCheckerStatus, ReputationCheckerStatus),
-        ):
+        self.__check_checker_status(checker_status)
+
+        if not self.token:
+            # Nothing can be submitted without a token.
+            return None
+
+        has_expiration_date = (
+            hasattr(checker_status, "expiration_date")
+            and checker_status.expiration_date
+        )
+
+        if self.is_modern_api is None:
+            # The API flavor is guessed through the first submission. The
+            # WHOIS data (legacy API only) are therefore submitted afterwards.
+            is_owner, data = self.__coalesce(
+                _GUESS_KEY,
+                self.__push_status,
+                checker_status.checker_type.lower(),
+                checker_status.to_json(),
+            )
+
+            if not is_owner:
+                return self.push(checker_status)
+
+            if self.is_modern_api is False and has_expiration_date:
+                self.__push_whois(checker_status)
+
+            return data
+
+        if not self.is_modern_api and has_expiration_date:
+            self.__push_whois(checker_status)
+
+        data = self.__push_status(
+            checker_status.checker_type.lower(), checker_status.to_json()
+        )
+
+        return data
+
+    def __check_checker_status(
+        self,
+        checker_status: Union[
+            AvailabilityCheckerStatus, SyntaxCheckerStatus, ReputationCheckerStatus
+        ],
+    ) -> None:
+        """
+        Checks that the given status can be pushed to the platform.
+
+        :param checker_status:
+            The status to check.
+
+        :raise TypeError:
+            - When the given :code:`checker_status` is not a
+              :py:class:`AvailabilityCheckerStatus`,
+              :py:class:`SyntaxCheckerStatus` or
+              :py:class:`ReputationCheckerStatus`.
+
+            - When the given :code:`checker_status.subject` is not a
+              :py:class:`str`.
+
+        :raise ValueError:
+            When the given :code:`checker_status.subject` is empty.
+        """
+
+        if type(checker_status) not in _STATUS_TYPES:
             raise TypeError(
                 f"<checker_status> should be {AvailabilityCheckerStatus}, "
                 f"{SyntaxCheckerStatus} or {ReputationCheckerStatus}, "
@@ -849,19 +1968,310 @@ class PlatformQueryTool:
         if checker_status.subject == "":
             raise ValueError("<checker_status.subject> cannot be empty.")
 
+    def __has_aio_session(self) -> bool:
+        """
+        Checks whether an (open) :py:class:`aiohttp.ClientSession` is bound to
+        the currently running loop.
+        """
+
+        return (
+            self._aio_session is not None
+            and not self._aio_session.closed
+            and self._aio_loop is asyncio.get_running_loop()
+        )
+
+    def _get_aio_session(self, concurrency: Optional[int] = None) -> Any:
+        """
+        Provides the :py:class:`aiohttp.ClientSession` bound to the currently
+        running loop. A new one is created if none is available yet.
+
+        .. warning::
+            The session can only be closed from the loop it is bound to. When
+            using :meth:`apull` or :meth:`apush`, await :meth:`close` before
+            your loop ends.
+
+        :param concurrency:
+            The maximum number of simultaneous connections.
+
+        :raise RuntimeError:
+            When :code:`aiohttp` is not installed.
+        """
+
+        if aiohttp is None:
+            raise RuntimeError("<aiohttp> is required by the asynchronous API.")
+
+        if not self.__has_aio_session():
+            self._aio_session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=concurrency or self.STD_POOL_SIZE,
+                    ttl_dns_cache=300,
+                    keepalive_timeout=30,
+                ),
+                timeout=aiohttp.ClientTimeout(total=self.timeout),
+                headers=dict(self.session.headers),
+            )
+            self._aio_loop = asyncio.get_running_loop()
+
+        return self._aio_session
+
+    async def __apost(self, url: str, data: Any, timeout: float) -> Optional[dict]:
+        """
+        Asynchronously posts the given data and provides the decoded response
+        - if successful.
+
+        :param url:
+            The URL to post to.
+        :param data:
+            The data to post. A :py:class:`dict` is encoded to JSON.
+        :param timeout:
+            The timeout of the request.
+        """
+
+        session = self._get_aio_session()
+        circuit_breaker = self._get_circuit_breaker()
+
+        if isinstance(data, dict):
+            data = _json_dumps(data)
+
+        if not circuit_breaker.allow():
+            PyFunceble.facility.Logger.debug(
+                "Circuit open for %s. Not posting data to %s.", self.url_base, url
+            )
+
+            return None
+
+        self.__count("requests")
+
+        try:
+            async with session.post(
+                url, data=data, timeout=aiohttp.ClientTimeout(total=timeout)
+            ) as response:
+                if response.status >= 500:
+                    self.__count("5xx")
+
+                    if circuit_breaker.record_failure():
+                        self.__count("trips")
+                else:
+                    circuit_breaker.record_success()
+
+                response_json = _json_loads(await self._aread_content(response))
+
+                if response.status == 200:
+                    PyFunceble.facility.Logger.debug(
+                        "Successfully posted data to %s. Response: %r",
+                        url,
+                        response_json,
+                    )
+
+                    return response_json
+        except (aiohttp.ClientError, asyncio.TimeoutError):
+            self.__count("errors")
+
+            if circuit_breaker.record_failure():
+                self.__count("trips")
+            response_json = {}
+        except (json.decoder.JSONDecodeError, PlatformResponseTooLarge):
+            response_json = {}
+
+        PyFunceble.facility.Logger.debug(
+            "Failed to post data to %s. Response: %r", url, response_json
+        )
+
+        return None
+
+    async def apull(self, subject: str) -> Optional[dict]:
+        """
+        Asynchronously pulls all data related to the subject or
+        :py:class:`None`.
+
+        The underlying session is kept for the next calls: await
+        :meth:`close` before your loop ends.
+
+        :param subject:
+            The subject to search for.
+
+        :raise TypeError:
+            When the given :code:`subject` is not a :py:class:`str`.
+
+        :return:
+            The response of the search.
+        """
+
+        PyFunceble.facility.Logger.info("Starting to search subject: %r", subject)
+
+        if not isinstance(subject, str):
+            raise TypeError(f"<subject> should be {str}, {type(subject)} given.")
+
+        if self.is_modern_api is None and not self.token:
+            # No request involved.
+            self.guess_and_set_is_modern_api()
+
+        if self.is_modern_api is None:
+            # The API flavor is guessed through the first (blocking) search.
+            return await asyncio.get_running_loop().run_in_executor(
+                None, self.pull, subject
+            )
+
+        url = self._get_urls()["pull"]
+        data = self._pull_cache.get((url, subject))
+
+        if data is not None:
+            self.__count("hits")
+        else:
+            self.__count("misses")
+
+            loop = asyncio.get_running_loop()
+            future = self._ainflight.get((loop, url, subject))
+
+            if future is not None:
+                # Another task is already searching for the same subject.
+                self.__count("coalesced")
+                data = await asyncio.shield(future)
+            else:
+                future = loop.create_future()
+                self._ainflight[(loop, url, subject)] = future
+
+                started_at = time.perf_counter()
+
+                try:
+                    data = await self.__apost(url, {"subject": subject}, self.timeout)
+
+                    if data is not None:
+                        self._pull_cache.set((url, subject), data)
+                finally:
+                    self.__record_latency(started_at)
+                    del self._ainflight[(loop, url, subject)]
+
+                    if not future.done():
+                        future.set_result(data)
+
+        PyFunceble.facility.Logger.info("Finished to search subject: %r", subject)
+
+        return data
+
+    async def apush(
+        self,
+        checker_status: Union[
+            AvailabilityCheckerStatus, SyntaxCheckerStatus, ReputationCheckerStatus
+        ],
+    ) -> Optional[dict]:
+        """
+        Asynchronously push the given status to the platform.
+
+        The underlying session is kept for the next calls: await
+        :meth:`close` before your loop ends.
+
+        :param checker_status:
+            The status to push.
+
+        :raise TypeError:
+            - When the given :code:`checker_status` is not a
+              :py:class:`AvailabilityCheckerStatus`,
+              :py:class:`SyntaxCheckerStatus` or
+              :py:class:`ReputationCheckerStatus`.
+
+            - When the given :code:`checker_status.subject` is not a
+              :py:class:`str`.
+
+        :raise ValueError:
+            When the given :code:`checker_status.subject` is empty.
+        """
+
+        self.__check_checker_status(checker_status)
+
+        if not self.token:
+            return None
+
+        if self.is_modern_api is None:
+            # The API flavor is guessed through the first (blocking) submission.
+            return await asyncio.get_running_loop().run_in_executor(
+                None, self.push, checker_status
+            )
+
+        checker_type = checker_status.checker_type.lower()
+
+        if checker_type not in self.SUPPORTED_CHECKERS:
+            raise ValueError(f"<checker_type> ({checker_type}) is not supported.")
+
         if (
             not self.is_modern_api
             and hasattr(checker_status, "expiration_date")
             and checker_status.expiration_date
         ):
-            self.__push_whois(checker_status)
+            PyFunceble.facility.Logger.info(
+                "Starting to submit WHOIS: %r", checker_status
+            )
 
-        data = self.__push_status(
-            checker_status.checker_type.lower(), checker_status.to_json()
+            await self.__apost(
+                self._get_urls()["whois"],
+                checker_status.to_json(),
+                self.timeout * 10,
+            )
+
+            PyFunceble.facility.Logger.info(
+                "Finished to submit WHOIS: %r", checker_status
+            )
+
+        PyFunceble.facility.Logger.info("Starting to submit status: %r", checker_status)
+
+        data = await self.__apost(
+            self._get_urls()[f"push_{checker_type}"],
+            checker_status.to_json(),
+            self.timeout * 10,
         )
 
+        PyFunceble.facility.Logger.info("Finished to submit status: %r", checker_status)
+
         return data
 
+    async def pull_many(
+        self, subjects: List[str], concurrency: int = 32
+    ) -> List[Optional[dict]]:
+        """
+        Asynchronously pulls the data of all given subjects.
+
+        :param subjects:
+            The subjects to search for.
+        :param concurrency:
+            The maximum number of simultaneous requests.
+
+        :return:
+            The responses of the searches - in the same order as the given
+            subjects.
+
+        .. note::
+            When no session is bound to the running loop yet, we create one -
+            limited to :code:`concurrency` connections - and close it once
+            done. Otherwise, the existing session is used as is.
+        """
+
+        semaphore = asyncio.Semaphore(concurrency)
+        owns_session = aiohttp is not None and not self.__has_aio_session()
+
+        if owns_session:
+            self._get_aio_session(concurrency)
+
+        async def bounded_pull(subject: str) -> Optional[dict]:
+            async with semaphore:
+                return await self.apull(subject)
+
+        try:
+            return list(await asyncio.gather(*(bounded_pull(x) for x in subjects)))
+        finally:
+            if owns_session:
+                await self.close()
+
+    async def close(self) -> None:
+        """
+        Closes the asynchronous session - if any.
+        """
+
+        if self._aio_session is not None and not self._aio_session.closed:
+            await self._aio_session.close()
+
+        self._aio_session = None
+        self._aio_loop = None
+
     def guess_all_settings(
         self,
     ) -> "PlatformQueryTool":  # pragma: no cover ## Underlying tested
@@ -869,12 +2279,7 @@ class PlatformQueryTool:
         Try to guess all settings.
         """
 
-        to_ignore = ["guess_all_settings"]
-
-        for method in dir(self):
-            if method in to_ignore or not method.startswith("guess_"):
-                continue
-
+        for method in self.GUESS_METHODS:
             getattr(self, method)()
 
         return self
@@ -902,63 +2307,75 @@ class PlatformQueryTool:
         if not self.token:
             return None
 
+        logger = PyFunceble.facility.Logger
+        log_info = logger.is_enabled_for(logging.INFO)
+        log_debug = logger.is_enabled_for(logging.DEBUG)
+
         if checker_type not in self.SUPPORTED_CHECKERS:
             raise ValueError(f"<checker_type> ({checker_type}) is not supported.")
 
-        PyFunceble.facility.Logger.info("Starting to submit status: %r", data)
+        if log_info:
+            logger.info("Starting to submit status: %r", data)
 
-        if self.is_modern_api:
-            if not self.token:
-                url = f"{self.url_base}/v1/hub/status/{checker_type}"
-            else:
-                url = f"{self.url_base}/v1/contracts/self-delivery"
+        if isinstance(data, dict):
+            payload = _json_dumps(data)
+        elif type(data) in _STATUS_TYPES:
+            payload = _json_dumps(data.to_dict())
         else:
-            url = f"{self.url_base}/v1/status/{checker_type}"
+            payload = data
+
+        url = self._get_urls()[f"push_{checker_type}"]
+        started_at = time.perf_counter()
 
         try:
-            if isinstance(data, dict):
-                response = self.session.post(
-                    url,
-                    json=data,
-                    timeout=self.timeout * 10,
+            if self.is_modern_api is None:
+                # The API flavor is guessed through the first submission.
+                response, content = self.__post_and_guess_is_modern_api(
+                    f"push_{checker_type}", payload, self.timeout * 10
                 )
-            elif isinstance(
-                data,
-                (
-                    AvailabilityCheckerStatus,
-                    SyntaxCheckerStatus,
-                    ReputationCheckerStatus,
-                ),
-            ):
-                response = self.session.post(
+                url = self._get_urls()[f"push_{checker_type}"]
+
+                if response is not None:
+                    response_json = _json_loads(content)
+                else:
+                    response_json = {}
+            elif not self.__is_idempotent(url):
+                response = self._request(
+                    "POST",
                     url,
-                    json=data.to_dict(),
+                    data=payload,
                     timeout=self.timeout * 10,
+                    idempotent=False,
+                    stream=True,
                 )
+                response_json = _json_loads(self._read_content(response))
             else:
-                response = self.session.post(
-                    url,
-                    data=data,
-                    timeout=self.timeout * 10,
+                response, response_json = self._retry_post(
+                    url, data=payload, timeout=self.timeout * 10
                 )
 
-            response_json = response.json()
+            if response is not None and response.status_code == 200:
+                if log_debug:
+                    logger.debug("Successfully submitted data: %r to %s", data, url)
 
-            if response.status_code == 200:
-                PyFunceble.facility.Logger.debug(
-                    "Successfully submitted data: %r to %s", data, url
-                )
-
-                PyFunceble.facility.Logger.info("Finished to submit status: %r", data)
+                if log_info:
+                    logger.info("Finished to submit status: %r", data)
                 return response_json
-        except (requests.RequestException, json.decoder.JSONDecodeError):
+        except _NET_EXC:
             response_json = {}
+        finally:
+            self.__record_latency(started_at)
 
-        PyFunceble.facility.Logger.debug(
-            "Failed to submit data: %r to %s. Response: %r", data, url, response_json
-        )
+        if log_debug:
+            logger.debug(
+                "Failed to submit data: %r to %s. Response: %r",
+                data,
+                url,
+                response_json,
+            )
 
-        PyFunceble.facility.Logger.info("Finished to submit status: %r", data)
+        if log_info:
+            logger.info("Finished to submit status: %r", data)
 
         return None
 
@@ -983,52 +2400,60 @@ class PlatformQueryTool:
         if not self.token:
             return None
 
-        PyFunceble.facility.Logger.info("Starting to submit WHOIS: %r", data)
+        logger = PyFunceble.facility.Logger
+        log_info = logger.is_enabled_for(logging.INFO)
+        log_debug = logger.is_enabled_for(logging.DEBUG)
 
-        url = f"{self.url_base}/v1/status/whois"
+        if log_info:
+            logger.info("Starting to submit WHOIS: %r", data)
+
+        url = self._get_urls()["whois"]
 
         try:
             if isinstance(data, dict):
-                response = self.session.post(
+                response = self._request(
+                    "POST",
                     url,
-                    json=data,
+                    data=_json_dumps(data),
                     timeout=self.timeout * 10,
+                    stream=True,
                 )
-            elif isinstance(
-                data,
-                (
-                    AvailabilityCheckerStatus,
-                    SyntaxCheckerStatus,
-                    ReputationCheckerStatus,
-                ),
-            ):
-                response = self.session.post(
+            elif type(data) in _STATUS_TYPES:
+                response = self._request(
+                    "POST",
                     url,
                     data=data.to_json(),
                     timeout=self.timeout * 10,
+                    stream=True,
                 )
             else:
-                response = self.session.post(
+                response = self._request(
+                    "POST",
                     url,
                     data=data,
                     timeout=self.timeout * 10,
+                    stream=True,
                 )
 
-            response_json = response.json()
+            response_json = _json_loads(self._read_content(response))
 
             if response.status_code == 200:
-                PyFunceble.facility.Logger.debug(
-                    "Successfully submitted WHOIS data: %r to %s", data, url
-                )
+                if log_debug:
+                    logger.debug(
+                        "Successfully submitted WHOIS data: %r to %s", data, url
+                    )
 
-                PyFunceble.facility.Logger.info("Finished to submit WHOIS: %r", data)
+                if log_info:
+                    logger.info("Finished to submit WHOIS: %r", data)
                 return response_json
-        except (requests.RequestException, json.decoder.JSONDecodeError):
+        except _NET_EXC:
             response_json = {}
 
-        PyFunceble.facility.Logger.debug(
-            "Failed to WHOIS data: %r to %s. Response: %r", data, url, response_json
-        )
+        if log_debug:
+            logger.debug(
+                "Failed to WHOIS data: %r to %s. Response: %r", data, url, response_json
+            )
 
-        PyFunceble.facility.Logger.info("Finished to submit WHOIS: %r", data)
+        if log_info:
+            logger.info("Finished to submit WHOIS: %r", data)
         return None
@@ -141,6 +141,8 @@ def get_requirements(*, mode="standard"):
         "docs": ["requirements.docs.txt"],
         "test": ["requirements.test.txt"],
         "psql": ["requirements.txt"],
+        "async": ["requirements.txt"],
+        "speedups": ["requirements.txt"],
     }
 
     if is_win_platform():
@@ -179,6 +181,10 @@ def get_requirements(*, mode="standard"):
 
     if mode == "psql":
         result.add("psycopg2")
+    elif mode == "async":
+        result.add("aiohttp")
+    elif mode == "speedups":
+        result.add("orjson")
 
     return list(result)
 
@@ -259,6 +265,8 @@ if __name__ == "__main__":
             "dev": get_requirements(mode="dev"),
             "test": get_requirements(mode="test"),
             "psql": get_requirements(mode="psql"),
+            "async": get_requirements(mode="async"),
+            "speedups": get_requirements(mode="speedups"),
             "full": get_requirements(mode="full"),
         },
         description="The tool to check the availability or syntax of domain, IP or URL.",
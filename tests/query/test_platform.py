@@ -52,16 +52,29 @@ License:
 
 # pylint: disable=too-many-lines
 
+import asyncio
+import concurrent.futures
+import gc
+import io
 import json
 import os
+import pickle
 import secrets
+import threading
 import unittest
 import unittest.mock
+import warnings
 from datetime import datetime
 
 import requests
 import requests.models
 
+try:
+    import aiohttp.test_utils
+    import aiohttp.web
+except ImportError:  # pragma: no cover ## Optional dependency
+    aiohttp = None
+
 from PyFunceble.checker.availability.status import AvailabilityCheckerStatus
 from PyFunceble.config.loader import ConfigLoader
 from PyFunceble.query.platform import PlatformQueryTool
@@ -193,6 +206,26 @@ class TestPlatformQueryTool(unittest.TestCase):
         del self.response_dataset
         del self.availability_status_dataset
 
+    def run_with_server(self, handler, func):
+        """
+        Runs the given coroutine function while a local server - answering
+        all POST requests through the given handler - is running.
+        """
+
+        async def run():
+            app = aiohttp.web.Application()
+            app.router.add_post("/{path:.*}", handler)
+
+            async with aiohttp.test_utils.TestServer(app) as server:
+                self.query_tool.url_base = f"http://{server.host}:{server.port}"
+
+                try:
+                    return await func()
+                finally:
+                    await self.query_tool.close()
+
+        return asyncio.run(run())
+
     def test_set_token_return(self) -> None:
         """
         Tests the response from the method which let us set the token to work
@@ -287,6 +320,201 @@ class TestPlatformQueryTool(unittest.TestCase):
 
         self.assertEqual(expected, actual)
 
+    def test_authorization_header(self) -> None:
+        """
+        Tests that the authorization header is only sent when a token is
+        given.
+        """
+
+        given = secrets.token_urlsafe(6)
+        expected = f"Bearer {given}"
+
+        query_tool = PlatformQueryTool(token=given)
+        actual = query_tool.session.headers["Authorization"]
+
+        self.assertEqual(expected, actual)
+
+    def test_authorization_header_token_not_given(self) -> None:
+        """
+        Tests that the authorization header is only sent when a token is
+        given.
+
+        In this test we test the case that no token is given.
+        """
+
+        query_tool = PlatformQueryTool(token="")
+
+        self.assertNotIn("Authorization", query_tool.session.headers)
+
+    def test_pool_size_through_environment_variable(self) -> None:
+        """
+        Tests that the size of the connection pool can be given through the
+        environment.
+        """
+
+        if "PYFUNCEBLE_COLLECTION_POOL_SIZE" in os.environ:
+            del os.environ["PYFUNCEBLE_COLLECTION_POOL_SIZE"]
+
+        os.environ["PYFUNCEBLE_PLATFORM_POOL_SIZE"] = "4"
+
+        expected = 4
+
+        query_tool = PlatformQueryTool()
+        # pylint: disable=protected-access
+        actual = query_tool.session.get_adapter("https://")._pool_maxsize
+
+        del os.environ["PYFUNCEBLE_PLATFORM_POOL_SIZE"]
+
+        self.assertEqual(expected, actual)
+
+    def test_pool_size_through_environment_variable_not_int(self) -> None:
+        """
+        Tests that the default size of the connection pool is used when the
+        environment variable is not an integer.
+        """
+
+        if "PYFUNCEBLE_COLLECTION_POOL_SIZE" in os.environ:
+            del os.environ["PYFUNCEBLE_COLLECTION_POOL_SIZE"]
+
+        os.environ["PYFUNCEBLE_PLATFORM_POOL_SIZE"] = "Hello, World!"
+
+        expected = PlatformQueryTool.STD_POOL_SIZE
+
+        query_tool = PlatformQueryTool()
+        # pylint: disable=protected-access
+        actual = query_tool.session.get_adapter("https://")._pool_maxsize
+
+        del os.environ["PYFUNCEBLE_PLATFORM_POOL_SIZE"]
+
+        self.assertEqual(expected, actual)
+
+    def test_retried_methods(self) -> None:
+        """
+        Tests that the POST requests which can't be safely repeated are not
+        retried by our session.
+        """
+
+        # pylint: disable=protected-access
+        retries = self.query_tool.session.get_adapter("https://").max_retries
+        self.assertEqual(frozenset(["GET", "POST"]), retries.allowed_methods)
+
+        retries = self.query_tool._non_idempotent_session.get_adapter(
+            "https://"
+        ).max_retries
+        self.assertEqual(frozenset(["GET"]), retries.allowed_methods)
+
+    def test_retry_after_ignored(self) -> None:
+        """
+        Tests that our sessions don't sleep for the delay given through the
+        Retry-After header.
+        """
+
+        # pylint: disable=protected-access
+        for session in (
+            self.query_tool.session,
+            self.query_tool._non_idempotent_session,
+        ):
+            retries = session.get_adapter("https://").max_retries
+
+            self.assertFalse(retries.respect_retry_after_header)
+
+    @unittest.mock.patch.object(requests.Session, "post", autospec=True)
+    def test_deliver_contract_not_retried(self, request_mock) -> None:
+        """
+        Tests that the delivery of a contract goes through the session which
+        doesn't retry the POST requests.
+        """
+
+        def mocking(*args, **kwargs):  # pylint: disable=unused-argument
+            response = requests.models.Response()
+            response.url = "https://example.org/v1/contracts/1/delivery"
+            response.status_code = 200
+
+            response.raw = io.BytesIO(b"{}")
+
+            response.history = [response]
+
+            return response
+
+        self.query_tool.url_base = "https://example.org"
+        request_mock.side_effect = mocking
+
+        self.query_tool.deliver_contract(
+            {"id": 1}, AvailabilityCheckerStatus(subject="example.org")
+        )
+
+        # pylint: disable=protected-access
+        self.assertIs(
+            self.query_tool._non_idempotent_session, request_mock.call_args[0][0]
+        )
+
+    @unittest.mock.patch.object(requests.Session, "post", autospec=True)
+    def test_push_self_delivery_not_retried(self, request_mock) -> None:
+        """
+        Tests that the self-delivery of a status goes through the session
+        which doesn't retry the POST requests - and isn't retried when its
+        response is truncated.
+        """
+
+        def mocking(*args, **kwargs):  # pylint: disable=unused-argument
+            response = requests.models.Response()
+            response.url = "https://example.org/v1/contracts/self-delivery"
+            response.status_code = 200
+            response.raw = io.BytesIO(b'{"subject": "exa')
+
+            response.history = [response]
+
+            return response
+
+        self.query_tool.url_base = "https://example.org"
+        self.query_tool.token = secrets.token_urlsafe(6)
+        request_mock.side_effect = mocking
+
+        # The first submission guesses the API flavor, the second one knows it.
+        for is_modern_api in (None, True):
+            with self.subTest(is_modern_api=is_modern_api):
+                request_mock.reset_mock()
+                self.assertEqual(is_modern_api, self.query_tool.is_modern_api)
+
+                actual = self.query_tool.push(
+                    AvailabilityCheckerStatus(**self.availability_status_dataset)
+                )
+
+                self.assertIsNone(actual)
+                self.assertEqual(1, request_mock.call_count)
+
+                # pylint: disable=protected-access
+                self.assertIs(
+                    self.query_tool._non_idempotent_session,
+                    request_mock.call_args[0][0],
+                )
+
+    @unittest.mock.patch.object(requests.Session, "post", autospec=True)
+    def test_pull_batch_retried(self, request_mock) -> None:
+        """
+        Tests that the batch search - which only reads - goes through the
+        session which retries the POST requests.
+        """
+
+        def mocking(*args, **kwargs):  # pylint: disable=unused-argument
+            response = requests.models.Response()
+            response.url = "https://example.org/v1/subject/search/batch"
+            response.status_code = 200
+            response.raw = io.BytesIO(b"[]")
+
+            response.history = [response]
+
+            return response
+
+        self.query_tool.url_base = "https://example.org"
+        self.query_tool.is_modern_api = False
+        request_mock.side_effect = mocking
+
+        self.query_tool.pull_batch(["example.org"])
+
+        # pylint: disable=protected-access
+        self.assertIs(self.query_tool.session, request_mock.call_args[0][0])
+
     def test_set_token_not_str(self) -> None:
         """
         Tests the method which let us set the token to work with for the case
@@ -717,6 +945,21 @@ class TestPlatformQueryTool(unittest.TestCase):
 
         del config_loader
 
+    def test_guess_all_settings(self) -> None:
+        """
+        Tests the method which let us guess all settings.
+        """
+
+        with unittest.mock.patch.object(
+            PlatformQueryTool, "guess_and_set_is_modern_api"
+        ) as is_modern_api_mock, unittest.mock.patch.object(
+            PlatformQueryTool, "guess_and_set_timeout"
+        ) as timeout_mock:
+            self.query_tool.guess_all_settings()
+
+        is_modern_api_mock.assert_called_once()
+        timeout_mock.assert_called_once()
+
     @unittest.mock.patch.object(requests.Session, "post")
     def test_platform_contain(self, request_mock) -> None:
         """
@@ -733,8 +976,7 @@ class TestPlatformQueryTool(unittest.TestCase):
             response.url = "https://example.org/v1/search"
             response.status_code = 200
 
-            # pylint: disable=protected-access
-            response._content = str.encode(response_content)
+            response.raw = io.BytesIO(str.encode(response_content))
 
             response.history = [response]
 
@@ -763,8 +1005,7 @@ class TestPlatformQueryTool(unittest.TestCase):
             response.url = "https://example.org/v1/search"
             response.status_code = 404
 
-            # pylint: disable=protected-access
-            response._content = str.encode(response_content)
+            response.raw = io.BytesIO(str.encode(response_content))
 
             response.history = [response]
 
@@ -794,8 +1035,7 @@ class TestPlatformQueryTool(unittest.TestCase):
             response.url = "https://example.org/v1/search"
             response.status_code = 200
 
-            # pylint: disable=protected-access
-            response._content = str.encode(response_content)
+            response.raw = io.BytesIO(str.encode(response_content))
 
             response.history = [response]
 
@@ -824,8 +1064,7 @@ class TestPlatformQueryTool(unittest.TestCase):
             response.url = "https://example.org/v1/search"
             response.status_code = 404
 
-            # pylint: disable=protected-access
-            response._content = str.encode(response_content)
+            response.raw = io.BytesIO(str.encode(response_content))
 
             response.history = [response]
 
@@ -855,8 +1094,7 @@ class TestPlatformQueryTool(unittest.TestCase):
             response.url = "https://example.org/v1/search"
             response.status_code = 200
 
-            # pylint: disable=protected-access
-            response._content = str.encode(response_content)
+            response.raw = io.BytesIO(str.encode(response_content))
 
             response.history = [response]
 
@@ -887,8 +1125,7 @@ class TestPlatformQueryTool(unittest.TestCase):
             response.url = "https://example.org/v1/search"
             response.status_code = 404
 
-            # pylint: disable=protected-access
-            response._content = str.encode(response_content)
+            response.raw = io.BytesIO(str.encode(response_content))
 
             response.history = [response]
 
@@ -917,8 +1154,7 @@ class TestPlatformQueryTool(unittest.TestCase):
             response.url = "https://example.org/v1/search"
             response.status_code = 418
 
-            # pylint: disable=protected-access
-            response._content = str.encode(response_content)
+            response.raw = io.BytesIO(str.encode(response_content))
 
             response.history = [response]
 
@@ -932,22 +1168,13 @@ class TestPlatformQueryTool(unittest.TestCase):
 
         self.assertEqual(expected, actual)
 
-    def test_pull_subject_not_str(self) -> None:
+    @unittest.mock.patch.object(requests.Session, "post")
+    def test_pull_cached(self, request_mock) -> None:
         """
         Tests the method which let us pull the subject from the platform.
 
-        In this test we test the case that the given subject is not a
-        :py:class:`str`.
-        """
-
-        self.query_tool.url_base = "https://example.org"
-
-        self.assertRaises(TypeError, lambda: self.query_tool.pull(284))
-
-    @unittest.mock.patch.object(requests.Session, "post")
-    def test_push(self, request_mock) -> None:
-        """
-        Tests the method which let us push some dataset into the platform.
+        In this test case we check that a successful response is served from
+        the cache on subsequent calls.
         """
 
         response_dict = self.response_dataset
@@ -957,168 +1184,1421 @@ class TestPlatformQueryTool(unittest.TestCase):
             response_content = json.dumps(response_dict)
 
             response = requests.models.Response()
-            response.url = "https://example.org/v1/status/availability"
+            response.url = "https://example.org/v1/search"
             response.status_code = 200
 
-            # pylint: disable=protected-access
-            response._content = str.encode(response_content)
+            response.raw = io.BytesIO(str.encode(response_content))
 
             response.history = [response]
 
             return response
 
         self.query_tool.url_base = "https://example.org"
-        self.query_tool.token = secrets.token_urlsafe(6)
-
         request_mock.side_effect = mocking
 
         expected = response_dict
-        actual = self.query_tool.push(
-            AvailabilityCheckerStatus(**self.availability_status_dataset)
-        )
 
-        self.assertEqual(expected, actual)
+        self.assertTrue("example.net" in self.query_tool)
+        self.assertEqual(expected, self.query_tool["example.net"])
+        self.assertEqual(1, request_mock.call_count)
+
+        self.query_tool.clear_pull_cache()
+
+        self.assertEqual(expected, self.query_tool.pull("example.net"))
+        self.assertEqual(2, request_mock.call_count)
 
     @unittest.mock.patch.object(requests.Session, "post")
-    def test_push_no_json_response(self, request_mock) -> None:
+    def test_pull_guess_legacy_api(self, request_mock) -> None:
         """
-        Tests the method which let us push some dataset into the platform.
+        Tests the method which let us pull the subject from the platform.
 
-        In this test case, we test the case that the response is not JSON
-        encoded.
+        In this test case we check that the API flavor is guessed from the
+        first search when the modern endpoint doesn't exist.
         """
 
         response_dict = self.response_dataset
         response_dict["subject"] = "example.net"
 
-        def mocking(*args, **kwargs):  # pylint: disable=unused-argument
-            response_content = "I'm a teapot."
-
+        def mocking(url, *args, **kwargs):  # pylint: disable=unused-argument
             response = requests.models.Response()
-            response.url = "https://example.org/v1/status/availability"
-            response.status_code = 418
+            response.url = url
 
-            # pylint: disable=protected-access
-            response._content = str.encode(response_content)
+            if "aggregation" in url:
+                response.status_code = 404
+                response_content = json.dumps({"detail": "Not Found"})
+            else:
+                response.status_code = 200
+                response_content = json.dumps(response_dict)
+
+            response.raw = io.BytesIO(str.encode(response_content))
 
             response.history = [response]
 
             return response
 
         self.query_tool.url_base = "https://example.org"
+        self.query_tool.token = "hello"
         request_mock.side_effect = mocking
 
-        expected = None
-        actual = self.query_tool.push(
-            AvailabilityCheckerStatus(**self.availability_status_dataset)
-        )
+        with unittest.mock.patch.object(requests.Session, "get") as probe_mock:
+            actual = self.query_tool.pull("example.net")
 
-        self.assertEqual(expected, actual)
+            probe_mock.assert_not_called()
+
+        self.assertEqual(response_dict, actual)
+        self.assertFalse(self.query_tool.is_modern_api)
+        self.assertEqual(2, request_mock.call_count)
+
+        self.assertEqual(response_dict, self.query_tool.pull("example.net"))
+        self.assertEqual(2, request_mock.call_count)
 
     @unittest.mock.patch.object(requests.Session, "post")
-    def test_push_with_whois(self, request_mock) -> None:
+    def test_pull_guess_modern_api(self, request_mock) -> None:
         """
-        Tests the method which let us push some dataset into the platform.
+        Tests the method which let us pull the subject from the platform.
+
+        In this test case we check that the API flavor is guessed from the
+        first search when the modern endpoint answers.
         """
 
         response_dict = self.response_dataset
         response_dict["subject"] = "example.net"
-        self.availability_status_dataset["expiration_date"] = "23-nov-2090"
 
-        def mocking(*args, **kwargs):  # pylint: disable=unused-argument
+        def mocking(url, *args, **kwargs):  # pylint: disable=unused-argument
             response_content = json.dumps(response_dict)
 
             response = requests.models.Response()
-            response.url = "https://example.org/v1/status/availability"
+            response.url = url
             response.status_code = 200
 
-            # pylint: disable=protected-access
-            response._content = str.encode(response_content)
+            response.raw = io.BytesIO(str.encode(response_content))
 
             response.history = [response]
 
             return response
 
         self.query_tool.url_base = "https://example.org"
-        self.query_tool.token = secrets.token_urlsafe(6)
+        self.query_tool.token = "hello"
         request_mock.side_effect = mocking
 
-        expected = response_dict
-        actual = self.query_tool.push(
-            AvailabilityCheckerStatus(**self.availability_status_dataset)
+        with unittest.mock.patch.object(requests.Session, "get") as probe_mock:
+            actual = self.query_tool.pull("example.net")
+
+            probe_mock.assert_not_called()
+
+        self.assertEqual(response_dict, actual)
+        self.assertTrue(self.query_tool.is_modern_api)
+        self.assertEqual(
+            "https://example.org/v1/aggregation/subject/search",
+            request_mock.call_args[0][0],
         )
 
+    @unittest.mock.patch.object(requests.Session, "post")
+    def test_pull_response_too_large(self, request_mock) -> None:
+        """
+        Tests the method which let us pull the subject from the platform.
+
+        In this test case we check that we don't read (and decode) responses
+        larger than the maximal response size.
+        """
+
+        def mocking(url, *args, **kwargs):  # pylint: disable=unused-argument
+            response = requests.models.Response()
+            response.url = url
+            response.status_code = 200
+            response.raw = io.BytesIO(b"[" + b"0," * 64 + b"0]")
+
+            response.history = [response]
+
+            return response
+
+        self.query_tool.url_base = "https://example.org"
+        self.query_tool.MAX_RESPONSE_SIZE = 64
+        request_mock.side_effect = mocking
+
+        expected = None
+        actual = self.query_tool.pull("example.net")
+
         self.assertEqual(expected, actual)
+        self.assertEqual(1, request_mock.call_count)
 
     @unittest.mock.patch.object(requests.Session, "post")
-    def test_push_with_whois_no_json_response(self, request_mock) -> None:
+    def test_pull_subject_not_found_not_cached(self, request_mock) -> None:
         """
-        Tests the method which let us push some dataset into the platform.
+        Tests the method which let us pull the subject from the platform.
+
+        In this test case we check that failed responses are not cached.
         """
 
-        response_dict = self.response_dataset
-        response_dict["subject"] = "example.net"
-        self.availability_status_dataset["expiration_date"] = "23-nov-2090"
+        response_dict = {"detail": "Invalid subject."}
 
         def mocking(*args, **kwargs):  # pylint: disable=unused-argument
-            response_content = "I'm a teapot."
+            response_content = json.dumps(response_dict)
 
             response = requests.models.Response()
-            response.url = "https://example.org/v1/status/availability"
-            response.status_code = 418
+            response.url = "https://example.org/v1/search"
+            response.status_code = 404
 
-            # pylint: disable=protected-access
-            response._content = str.encode(response_content)
+            response.raw = io.BytesIO(str.encode(response_content))
 
             response.history = [response]
 
             return response
 
         self.query_tool.url_base = "https://example.org"
-        self.query_tool.token = secrets.token_urlsafe(6)
         request_mock.side_effect = mocking
 
-        expected = None
-        actual = self.query_tool.push(
-            AvailabilityCheckerStatus(**self.availability_status_dataset)
-        )
-
-        self.assertEqual(expected, actual)
+        self.assertIsNone(self.query_tool.pull("example.net"))
+        self.assertIsNone(self.query_tool.pull("example.net"))
+        self.assertEqual(2, request_mock.call_count)
 
-    def test_push_with_whois_token_not_given(self) -> None:
+    @unittest.mock.patch.object(requests.Session, "post")
+    def test_pull_coalesced(self, request_mock) -> None:
         """
-        Tests the method which let us push some dataset into the platform.
+        Tests the method which let us pull the subject from the platform.
 
-        In this test, we test the case that no token is given.
+        In this test case we check that concurrent searches of the same subject
+        only issue a single request.
         """
 
         response_dict = self.response_dataset
         response_dict["subject"] = "example.net"
-        self.availability_status_dataset["expiration_date"] = "23-nov-2090"
 
-        if "PYFUNCEBLE_COLLECTION_API_TOKEN" in os.environ:
-            del os.environ["PYFUNCEBLE_COLLECTION_API_TOKEN"]
+        release = threading.Event()
 
-        if "PYFUNCEBLE_PLATFORM_API_TOKEN" in os.environ:
-            del os.environ["PYFUNCEBLE_PLATFORM_API_TOKEN"]
+        def mocking(*args, **kwargs):  # pylint: disable=unused-argument
+            release.wait(5)
 
-        self.query_tool.token = ""
+            response_content = json.dumps(response_dict)
 
-        expected = None
-        actual = self.query_tool.push(
-            AvailabilityCheckerStatus(**self.availability_status_dataset)
-        )
+            response = requests.models.Response()
+            response.url = "https://example.org/v1/search"
+            response.status_code = 200
+
+            response.raw = io.BytesIO(str.encode(response_content))
+
+            response.history = [response]
+
+            return response
+
+        self.query_tool.url_base = "https://example.org"
+        request_mock.side_effect = mocking
+
+        expected = [response_dict] * 4
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=4) as executor:
+            submitted = [
+                executor.submit(self.query_tool.pull, "example.net") for _ in range(4)
+            ]
+
+            release.set()
+
+            actual = [x.result() for x in submitted]
 
         self.assertEqual(expected, actual)
+        self.assertEqual(1, request_mock.call_count)
 
-    def test_push_subject_not_str(self) -> None:
+    @unittest.mock.patch.object(requests.Session, "post")
+    def test_pull_guess_coalesced(self, request_mock) -> None:
         """
-        Tests the method which let us push some dataset into the platform.
+        Tests the method which let us pull the subject from the platform.
 
-        In this test, we test the case that the given subject is not a string.
+        In this test case we check that concurrent first searches only guess
+        the API flavor once.
         """
 
-        self.availability_status_dataset["subject"] = 293
+        response_dict = self.response_dataset
+        response_dict["subject"] = "example.net"
+
+        release = threading.Event()
+
+        def mocking(url, *args, **kwargs):  # pylint: disable=unused-argument
+            release.wait(5)
+
+            response = requests.models.Response()
+            response.url = url
+
+            if "aggregation" in url:
+                response.status_code = 404
+                response.raw = io.BytesIO(b'{"detail": "Not Found"}')
+            else:
+                response.status_code = 200
+                response.raw = io.BytesIO(str.encode(json.dumps(response_dict)))
+
+            response.history = [response]
+
+            return response
+
+        self.query_tool.url_base = "https://example.org"
+        self.query_tool.token = "hello"
+        request_mock.side_effect = mocking
+
+        expected = [response_dict] * 4
+
+        with unittest.mock.patch.object(
+            requests.Session, "get"
+        ) as probe_mock, concurrent.futures.ThreadPoolExecutor(
+            max_workers=4
+        ) as executor:
+            submitted = [
+                executor.submit(self.query_tool.pull, "example.net") for _ in range(4)
+            ]
+
+            release.set()
+
+            actual = [x.result() for x in submitted]
+
+            probe_mock.assert_not_called()
+
+        self.assertEqual(expected, actual)
+        self.assertFalse(self.query_tool.is_modern_api)
+        self.assertEqual(2, request_mock.call_count)
+
+    def test_apull_coalesced(self) -> None:
+        """
+        Tests the method which let us asynchronously pull the subject from the
+        platform.
+
+        In this test case we check that concurrent searches of the same subject
+        only issue a single request.
+        """
+
+        response_dict = self.response_dataset
+        response_dict["subject"] = "example.net"
+
+        async def mocking(*args, **kwargs):  # pylint: disable=unused-argument
+            await asyncio.sleep(0.01)
+
+            return response_dict
+
+        async def pull_all():
+            return await asyncio.gather(
+                *(self.query_tool.apull("example.net") for _ in range(4))
+            )
+
+        self.query_tool.url_base = "https://example.org"
+
+        expected = [response_dict] * 4
+
+        with unittest.mock.patch.object(
+            PlatformQueryTool, "_PlatformQueryTool__apost", side_effect=mocking
+        ) as request_mock:
+            actual = asyncio.run(pull_all())
+
+        self.assertEqual(expected, actual)
+        self.assertEqual(1, request_mock.call_count)
+
+    @unittest.mock.patch.object(requests.Session, "post")
+    def test_pull_circuit_open(self, request_mock) -> None:
+        """
+        Tests the method which let us pull the subject from the platform.
+
+        In this test case we check that no request is issued anymore once the
+        platform kept failing.
+        """
+
+        request_mock.side_effect = requests.exceptions.ConnectionError()
+
+        self.query_tool.url_base = "https://example.org"
+
+        for _ in range(5):
+            self.assertIsNone(self.query_tool.pull("example.net"))
+
+        self.assertEqual(5, request_mock.call_count)
+
+        self.assertIsNone(self.query_tool.pull("example.net"))
+        self.assertEqual(5, request_mock.call_count)
+
+    def test_circuit_half_open(self) -> None:
+        """
+        Tests that a single trial request is let through once the circuit
+        was open long enough.
+        """
+
+        self.query_tool.url_base = "https://example.org"
+
+        # pylint: disable=protected-access
+        circuit_breaker = self.query_tool._get_circuit_breaker()
+
+        with unittest.mock.patch("time.monotonic") as monotonic_mock:
+            monotonic_mock.return_value = 100.0
+
+            for _ in range(circuit_breaker.fail_threshold):
+                circuit_breaker.record_failure()
+
+            self.assertFalse(circuit_breaker.allow())
+
+            monotonic_mock.return_value += circuit_breaker.reset_timeout
+
+            self.assertTrue(circuit_breaker.allow())
+            self.assertFalse(circuit_breaker.allow())
+            self.assertFalse(circuit_breaker.allow())
+
+            circuit_breaker.record_success()
+
+            self.assertTrue(circuit_breaker.allow())
+            self.assertTrue(circuit_breaker.allow())
+
+    def test_pickle(self) -> None:
+        """
+        Tests that the tool can be pickled - e.g. to be shipped to a worker
+        started through spawn.
+        """
+
+        self.query_tool = PlatformQueryTool(token=secrets.token_urlsafe(6))
+        self.query_tool.url_base = "https://example.org"
+        self.query_tool.timeout = 3.0
+        self.query_tool.clear_pull_cache()
+        self.query_tool.stats()
+
+        actual = pickle.loads(pickle.dumps(self.query_tool))
+
+        self.assertEqual(self.query_tool.token, actual.token)
+        self.assertEqual(self.query_tool.url_base, actual.url_base)
+        self.assertEqual(self.query_tool.timeout, actual.timeout)
+        self.assertEqual(self.query_tool.session.headers, actual.session.headers)
+        self.assertEqual(
+            self.query_tool._non_idempotent_session.headers,
+            actual._non_idempotent_session.headers,
+        )
+        self.assertEqual(self.query_tool.stats(), actual.stats())
+
+        # The process-local helpers are rebuilt.
+        self.assertIsNot(self.query_tool._pull_cache, actual._pull_cache)
+        self.assertEqual(self.query_tool._pull_cache.ttl, actual._pull_cache.ttl)
+        self.assertEqual(
+            self.query_tool._pull_cache.max_size, actual._pull_cache.max_size
+        )
+        self.assertEqual(0, len(actual._pull_cache))
+        self.assertEqual({}, actual._circuit_breakers)
+        self.assertIsNone(actual._aio_session)
+
+    @unittest.mock.patch.object(requests.Session, "post")
+    def test_pickle_pull(self, request_mock) -> None:
+        """
+        Tests that the unpickled tool is still usable.
+        """
+
+        response = requests.models.Response()
+        response.raw = io.BytesIO(json.dumps(self.response_dataset).encode("utf-8"))
+        response.status_code = 200
+
+        request_mock.return_value = response
+
+        self.query_tool.url_base = "https://example.org"
+        self.query_tool.is_modern_api = True
+
+        query_tool = pickle.loads(pickle.dumps(self.query_tool))
+
+        self.assertEqual(self.response_dataset, query_tool.pull("example.net"))
+        # Now from the (rebuilt) cache.
+        self.assertEqual(self.response_dataset, query_tool.pull("example.net"))
+
+        request_mock.assert_called_once()
+
+    @unittest.mock.patch.object(requests.Session, "post")
+    def test_stats(self, request_mock) -> None:
+        """
+        Tests the method which let us get what we observed while
+        communicating with the platform.
+        """
+
+        response_dict = self.response_dataset
+
+        def mocking(*args, **kwargs):  # pylint: disable=unused-argument
+            response_content = json.dumps(response_dict)
+
+            response = requests.models.Response()
+            response.url = "https://example.org/v1/search"
+            response.status_code = 200
+
+            response.raw = io.BytesIO(str.encode(response_content))
+
+            response.history = [response]
+
+            return response
+
+        self.query_tool.url_base = "https://example.org"
+        request_mock.side_effect = mocking
+
+        expected = {
+            "hits": 0,
+            "misses": 0,
+            "coalesced": 0,
+            "requests": 0,
+            "errors": 0,
+            "5xx": 0,
+            "trips": 0,
+            "latency_p50": None,
+            "latency_p95": None,
+        }
+        actual = self.query_tool.stats()
+
+        self.assertEqual(expected, actual)
+
+        self.query_tool.pull("example.net")
+        self.query_tool.pull("example.net")
+        self.query_tool.pull("example.org")
+
+        actual = self.query_tool.stats()
+
+        self.assertEqual(1, actual["hits"])
+        self.assertEqual(2, actual["misses"])
+        self.assertEqual(0, actual["coalesced"])
+        self.assertEqual(2, actual["requests"])
+        self.assertEqual(0, actual["errors"])
+        self.assertIsInstance(actual["latency_p50"], float)
+        self.assertLessEqual(actual["latency_p50"], actual["latency_p95"])
+
+    @unittest.mock.patch.object(requests.Session, "post")
+    def test_stats_circuit_open(self, request_mock) -> None:
+        """
+        Tests the method which let us get what we observed while
+        communicating with the platform.
+
+        In this test case we check that server errors and circuit openings
+        are accounted.
+        """
+
+        def mocking(*args, **kwargs):  # pylint: disable=unused-argument
+            response = requests.models.Response()
+            response.url = "https://example.org/v1/search"
+            response.status_code = 503
+
+            response.raw = io.BytesIO(b"Service Unavailable")
+
+            response.history = [response]
+
+            return response
+
+        self.query_tool.url_base = "https://example.org"
+        request_mock.side_effect = mocking
+
+        for _ in range(6):
+            self.query_tool.pull("example.net")
+
+        actual = self.query_tool.stats()
+
+        self.assertEqual(5, actual["requests"])
+        self.assertEqual(5, actual["5xx"])
+        self.assertEqual(1, actual["trips"])
+        # The refused searches are accounted too.
+        self.assertIsInstance(actual["latency_p50"], float)
+
+    @unittest.mock.patch.object(requests.Session, "post")
+    def test_stats_errors(self, request_mock) -> None:
+        """
+        Tests the method which let us get what we observed while
+        communicating with the platform.
+
+        In this test case we check that the requests failing without a
+        response are accounted.
+        """
+
+        request_mock.side_effect = requests.exceptions.ConnectTimeout()
+
+        self.query_tool.url_base = "https://example.org"
+
+        for _ in range(2):
+            self.query_tool.pull("example.net")
+
+        actual = self.query_tool.stats()
+
+        self.assertEqual(2, actual["requests"])
+        self.assertEqual(2, actual["errors"])
+        self.assertEqual(0, actual["5xx"])
+        self.assertIsInstance(actual["latency_p50"], float)
+
+    @unittest.mock.patch("time.sleep")
+    @unittest.mock.patch.object(requests.Session, "post")
+    def test_pull_retry_no_json_response(self, request_mock, _) -> None:
+        """
+        Tests the method which let us pull the subject from the platform.
+
+        In this test case we check that a truncated response is retried.
+        """
+
+        response_dict = self.response_dataset
+        response_dict["subject"] = "example.net"
+
+        responses = [
+            (200, json.dumps(response_dict)[:10]),
+            (200, json.dumps(response_dict)),
+        ]
+
+        def mocking(*args, **kwargs):  # pylint: disable=unused-argument
+            status_code, response_content = responses.pop(0)
+
+            response = requests.models.Response()
+            response.url = "https://example.org/v1/search"
+            response.status_code = status_code
+
+            response.raw = io.BytesIO(str.encode(response_content))
+
+            response.history = [response]
+
+            return response
+
+        self.query_tool.url_base = "https://example.org"
+        request_mock.side_effect = mocking
+
+        expected = response_dict
+        actual = self.query_tool.pull("example.net")
+
+        self.assertEqual(expected, actual)
+        self.assertEqual(2, request_mock.call_count)
+
+    @unittest.mock.patch("time.sleep")
+    @unittest.mock.patch.object(requests.Session, "post")
+    def test_pull_no_json_server_error_not_retried(self, request_mock, _) -> None:
+        """
+        Tests the method which let us pull the subject from the platform.
+
+        In this test case we check that a non JSON 5xx or 429 response is
+        not retried again - our session already did.
+        """
+
+        self.query_tool.url_base = "https://example.org"
+
+        for status_code in (502, 429):
+            with self.subTest(status_code=status_code):
+
+                def mocking(*args, **kwargs):  # pylint: disable=unused-argument
+                    response = requests.models.Response()
+                    response.url = "https://example.org/v1/search"
+                    response.status_code = status_code
+
+                    response.raw = io.BytesIO(b"<html>Oops</html>")
+
+                    response.history = [response]
+
+                    return response
+
+                request_mock.reset_mock()
+                request_mock.side_effect = mocking
+
+                expected = None
+                actual = self.query_tool.pull("example.net")
+
+                self.assertEqual(expected, actual)
+                self.assertEqual(1, request_mock.call_count)
+
+    @unittest.mock.patch.object(requests.Session, "post")
+    def test_pull_batch(self, request_mock) -> None:
+        """
+        Tests the method which let us pull multiple subjects from the platform
+        through a single request.
+        """
+
+        response_list = [{"subject": "example.org"}, {"subject": "example.net"}]
+
+        def mocking(*args, **kwargs):  # pylint: disable=unused-argument
+            response_content = json.dumps(response_list)
+
+            response = requests.models.Response()
+            response.url = "https://example.org/v1/search/batch"
+            response.status_code = 200
+
+            response.raw = io.BytesIO(str.encode(response_content))
+
+            response.history = [response]
+
+            return response
+
+        self.query_tool.url_base = "https://example.org"
+        request_mock.side_effect = mocking
+
+        expected = {
+            "example.org": {"subject": "example.org"},
+            "example.de": None,
+            "example.net": {"subject": "example.net"},
+        }
+        actual = self.query_tool.pull_batch(
+            ["example.org", "example.de", "example.net"]
+        )
+
+        self.assertEqual(expected, actual)
+
+        expected = {"subject": "example.net"}
+        actual = self.query_tool.pull("example.net")
+
+        self.assertEqual(expected, actual)
+        self.assertEqual(1, request_mock.call_count)
+
+    @unittest.mock.patch.object(requests.Session, "post")
+    def test_pull_batch_guess_api(self, request_mock) -> None:
+        """
+        Tests the method which let us pull multiple subjects from the platform
+        through a single request.
+
+        In this test case we check that the API flavor is guessed from a
+        first search.
+        """
+
+        def mocking(url, *args, **kwargs):  # pylint: disable=unused-argument
+            if url.endswith("/batch"):
+                response_content = json.dumps([{"subject": "example.net"}])
+            else:
+                response_content = json.dumps({"subject": "example.org"})
+
+            response = requests.models.Response()
+            response.url = url
+            response.status_code = 200
+            response.raw = io.BytesIO(str.encode(response_content))
+
+            response.history = [response]
+
+            return response
+
+        self.query_tool.url_base = "https://example.org"
+        self.query_tool.token = "hello"
+        request_mock.side_effect = mocking
+
+        expected = {
+            "example.org": {"subject": "example.org"},
+            "example.net": {"subject": "example.net"},
+        }
+
+        with unittest.mock.patch.object(requests.Session, "get") as probe_mock:
+            actual = self.query_tool.pull_batch(["example.org", "example.net"])
+
+            probe_mock.assert_not_called()
+
+        self.assertEqual(expected, actual)
+        self.assertTrue(self.query_tool.is_modern_api)
+        self.assertEqual(
+            [
+                "https://example.org/v1/aggregation/subject/search",
+                "https://example.org/v1/aggregation/subject/search/batch",
+            ],
+            [x[0][0] for x in request_mock.call_args_list],
+        )
+
+    @unittest.mock.patch.object(requests.Session, "post")
+    def test_pull_batch_not_supported(self, request_mock) -> None:
+        """
+        Tests the method which let us pull multiple subjects from the platform
+        through a single request.
+
+        In this test case we check that we fall back to individual searches
+        when batch searches are not supported.
+        """
+
+        def mocking(*args, **kwargs):  # pylint: disable=unused-argument
+            response = requests.models.Response()
+            response.url = "https://example.org/v1/search/batch"
+            response.status_code = 404
+            response.raw = io.BytesIO(b"Not Found")
+
+            response.history = [response]
+
+            return response
+
+        async def pull_many_mocking(subjects, *args, **kwargs):
+            return [{"subject": x} for x in subjects]
+
+        self.query_tool.url_base = "https://example.org"
+        request_mock.side_effect = mocking
+
+        expected = {
+            "example.org": {"subject": "example.org"},
+            "example.net": {"subject": "example.net"},
+        }
+
+        with unittest.mock.patch.object(
+            PlatformQueryTool, "pull_many", side_effect=pull_many_mocking
+        ), unittest.mock.patch.object(
+            PlatformQueryTool, "pull", side_effect=lambda x: {"subject": x}
+        ):
+            actual = self.query_tool.pull_batch(["example.org", "example.net"])
+
+        self.assertEqual(expected, actual)
+
+    @unittest.mock.patch.object(requests.Session, "post")
+    def test_pull_batch_not_supported_running_loop(self, request_mock) -> None:
+        """
+        Tests the method which let us pull multiple subjects from the platform
+        through a single request.
+
+        In this test case we check that we fall back to :meth:`pull` when
+        batch searches are not supported and an event loop is already
+        running.
+        """
+
+        def mocking(*args, **kwargs):  # pylint: disable=unused-argument
+            response = requests.models.Response()
+            response.url = "https://example.org/v1/search/batch"
+            response.status_code = 404
+            response.raw = io.BytesIO(b"Not Found")
+
+            response.history = [response]
+
+            return response
+
+        self.query_tool.url_base = "https://example.org"
+        request_mock.side_effect = mocking
+
+        expected = {
+            "example.org": {"subject": "example.org"},
+            "example.net": {"subject": "example.net"},
+        }
+
+        async def pull_batch():
+            return self.query_tool.pull_batch(["example.org", "example.net"])
+
+        with unittest.mock.patch.object(
+            PlatformQueryTool, "pull_many"
+        ) as pull_many_mock, unittest.mock.patch.object(
+            PlatformQueryTool, "pull", side_effect=lambda x: {"subject": x}
+        ):
+            actual = asyncio.run(pull_batch())
+
+            pull_many_mock.assert_not_called()
+
+        self.assertEqual(expected, actual)
+
+    @unittest.mock.patch.object(requests.Session, "post")
+    def test_pull_batch_unexpected_response(self, request_mock) -> None:
+        """
+        Tests the method which let us pull multiple subjects from the platform
+        through a single request.
+
+        In this test case we check that a response which is neither a list
+        nor a dict is ignored.
+        """
+
+        def mocking(*args, **kwargs):  # pylint: disable=unused-argument
+            response = requests.models.Response()
+            response.url = "https://example.org/v1/search/batch"
+            response.status_code = 200
+
+            response.raw = io.BytesIO(b'"Hello, World!"')
+
+            response.history = [response]
+
+            return response
+
+        self.query_tool.url_base = "https://example.org"
+        request_mock.side_effect = mocking
+
+        expected = {"example.org": None, "example.net": None}
+        actual = self.query_tool.pull_batch(["example.org", "example.net"])
+
+        self.assertEqual(expected, actual)
+
+    @unittest.mock.patch.object(requests.Session, "post")
+    def test_pull_batch_response_too_large(self, request_mock) -> None:
+        """
+        Tests the method which let us pull multiple subjects from the platform
+        through a single request.
+
+        In this test case we check that we don't read (and decode) responses
+        larger than the maximal response size.
+        """
+
+        def mocking(*args, **kwargs):  # pylint: disable=unused-argument
+            response = requests.models.Response()
+            response.url = "https://example.org/v1/search/batch"
+            response.status_code = 200
+            response.raw = io.BytesIO(b'[{"subject": "example.org"}' + b" " * 64 + b"]")
+
+            response.history = [response]
+
+            return response
+
+        self.query_tool.url_base = "https://example.org"
+        self.query_tool.MAX_RESPONSE_SIZE = 64
+        request_mock.side_effect = mocking
+
+        expected = {"example.org": None}
+        actual = self.query_tool.pull_batch(["example.org"])
+
+        self.assertEqual(expected, actual)
+
+    @unittest.skipIf(aiohttp is None, "aiohttp is not installed.")
+    def test_apull(self) -> None:
+        """
+        Tests the method which let us asynchronously pull the subject from
+        the platform.
+        """
+
+        requested = []
+
+        async def handler(request):
+            requested.append((request.path, await request.json()))
+
+            return aiohttp.web.json_response(self.response_dataset)
+
+        self.query_tool.is_modern_api = False
+
+        async def apull_twice():
+            return [
+                await self.query_tool.apull("example.net"),
+                await self.query_tool.apull("example.net"),
+            ]
+
+        expected = [self.response_dataset, self.response_dataset]
+        actual = self.run_with_server(handler, apull_twice)
+
+        self.assertEqual(expected, actual)
+        self.assertEqual(
+            [("/v1/subject/search", {"subject": "example.net"})], requested
+        )
+
+    @unittest.skipIf(aiohttp is None, "aiohttp is not installed.")
+    def test_apull_guess_api(self) -> None:
+        """
+        Tests the method which let us asynchronously pull the subject from
+        the platform.
+
+        In this test case we check that the API flavor is guessed from the
+        first search.
+        """
+
+        requested = []
+
+        async def handler(request):
+            requested.append(request.path)
+
+            if "aggregation" in request.path:
+                return aiohttp.web.json_response({"detail": "Not Found"}, status=404)
+
+            return aiohttp.web.json_response(self.response_dataset)
+
+        self.query_tool.token = "hello"
+
+        async def apull_twice():
+            return [
+                await self.query_tool.apull("example.net"),
+                await self.query_tool.apull("example.org"),
+            ]
+
+        expected = [self.response_dataset, self.response_dataset]
+        actual = self.run_with_server(handler, apull_twice)
+
+        self.assertEqual(expected, actual)
+        self.assertFalse(self.query_tool.is_modern_api)
+        self.assertEqual(
+            [
+                "/v1/aggregation/subject/search",
+                "/v1/subject/search",
+                "/v1/subject/search",
+            ],
+            requested,
+        )
+
+    @unittest.skipIf(aiohttp is None, "aiohttp is not installed.")
+    def test_apull_server_error(self) -> None:
+        """
+        Tests the method which let us asynchronously pull the subject from
+        the platform.
+
+        In this test case we check what happens when the platform fails.
+        """
+
+        async def handler(_):
+            return aiohttp.web.Response(status=500, text="Internal Server Error")
+
+        self.query_tool.is_modern_api = False
+
+        expected = None
+        actual = self.run_with_server(
+            handler, lambda: self.query_tool.apull("example.net")
+        )
+
+        self.assertEqual(expected, actual)
+        self.assertEqual(1, self.query_tool.stats()["5xx"])
+
+    @unittest.skipIf(aiohttp is None, "aiohttp is not installed.")
+    def test_apush(self) -> None:
+        """
+        Tests the method which let us asynchronously push a status to the
+        platform.
+        """
+
+        requested = []
+
+        async def handler(request):
+            requested.append(
+                (
+                    request.path,
+                    request.headers.get("Authorization"),
+                    (await request.json())["subject"],
+                )
+            )
+
+            return aiohttp.web.json_response(self.status_dataset)
+
+        self.query_tool = PlatformQueryTool(token="hello")
+        self.query_tool.is_modern_api = True
+
+        status = AvailabilityCheckerStatus(**self.availability_status_dataset)
+
+        expected = self.status_dataset
+        actual = self.run_with_server(handler, lambda: self.query_tool.apush(status))
+
+        self.assertEqual(expected, actual)
+        self.assertEqual(
+            [("/v1/contracts/self-delivery", "Bearer hello", "example.com")], requested
+        )
+
+    @unittest.skipIf(aiohttp is None, "aiohttp is not installed.")
+    def test_get_aio_session(self) -> None:
+        """
+        Tests the method which provides the aiohttp session to use.
+        """
+
+        # pylint: disable=protected-access
+
+        async def get_sessions():
+            try:
+                first = self.query_tool._get_aio_session()
+                second = self.query_tool._get_aio_session()
+
+                await self.query_tool.close()
+
+                return first, second, self.query_tool._get_aio_session()
+            finally:
+                await self.query_tool.close()
+
+        first, second, after_close = asyncio.run(get_sessions())
+
+        self.assertIs(first, second)
+        self.assertIsNot(first, after_close)
+        self.assertTrue(first.closed)
+
+        first_of_other_loop, _, _ = asyncio.run(get_sessions())
+
+        self.assertIsNot(first, first_of_other_loop)
+        self.assertIsNot(after_close, first_of_other_loop)
+
+    @unittest.skipIf(aiohttp is None, "aiohttp is not installed.")
+    def test_apull_response_too_large(self) -> None:
+        """
+        Tests the method which let us asynchronously pull the subject from
+        the platform.
+
+        In this test case we check that we don't read (and decode) responses
+        larger than the maximal response size.
+        """
+
+        async def handler(request):
+            return aiohttp.web.json_response(
+                {"subject": (await request.json())["subject"], "pad": "a" * 64}
+            )
+
+        self.query_tool.is_modern_api = False
+        self.query_tool.MAX_RESPONSE_SIZE = 64
+
+        expected = None
+        actual = self.run_with_server(
+            handler, lambda: self.query_tool.apull("example.org")
+        )
+
+        self.assertEqual(expected, actual)
+
+        self.query_tool.MAX_RESPONSE_SIZE = 1024
+
+        expected = {"subject": "example.net", "pad": "a" * 64}
+        actual = self.run_with_server(
+            handler, lambda: self.query_tool.apull("example.net")
+        )
+
+        self.assertEqual(expected, actual)
+
+    def test_pull_subject_not_str(self) -> None:
+        """
+        Tests the method which let us pull the subject from the platform.
+
+        In this test we test the case that the given subject is not a
+        :py:class:`str`.
+        """
+
+        self.query_tool.url_base = "https://example.org"
+
+        self.assertRaises(TypeError, lambda: self.query_tool.pull(284))
+
+    def test_pull_many(self) -> None:
+        """
+        Tests the method which let us pull multiple subjects from the platform
+        asynchronously.
+        """
+
+        async def mocking(subject: str):
+            if subject == "example.de":
+                return None
+            return {"subject": subject}
+
+        given = ["example.org", "example.de", "example.net"]
+        expected = [{"subject": "example.org"}, None, {"subject": "example.net"}]
+
+        async def pull_many():
+            try:
+                return await self.query_tool.pull_many(given, concurrency=2)
+            finally:
+                await self.query_tool.close()
+
+        with unittest.mock.patch.object(
+            PlatformQueryTool, "apull", side_effect=mocking
+        ):
+            actual = asyncio.run(pull_many())
+
+        self.assertEqual(expected, actual)
+
+    @unittest.skipIf(aiohttp is None, "aiohttp is not installed.")
+    def test_pull_many_closes_session(self) -> None:
+        """
+        Tests the method which let us pull multiple subjects from the platform
+        asynchronously.
+
+        In this test case we check that the session created for the searches
+        is closed once done - so that it doesn't leak from a loop to another.
+        """
+
+        async def handler(request):
+            return aiohttp.web.json_response(await request.json())
+
+        self.query_tool.is_modern_api = False
+
+        async def pull_many():
+            actual = await self.query_tool.pull_many(["example.org"], concurrency=2)
+
+            # pylint: disable=protected-access
+            self.assertIsNone(self.query_tool._aio_session)
+
+            return actual
+
+        with warnings.catch_warnings():
+            warnings.simplefilter("error", ResourceWarning)
+
+            for _ in range(2):
+                self.query_tool.clear_pull_cache()
+
+                actual = self.run_with_server(handler, pull_many)
+                gc.collect()
+
+                self.assertEqual([{"subject": "example.org"}], actual)
+
+    @unittest.skipIf(aiohttp is None, "aiohttp is not installed.")
+    def test_pull_many_existing_session(self) -> None:
+        """
+        Tests the method which let us pull multiple subjects from the platform
+        asynchronously.
+
+        In this test case we check that an existing session is reused - and
+        left open.
+        """
+
+        async def handler(request):
+            return aiohttp.web.json_response(await request.json())
+
+        self.query_tool.is_modern_api = False
+
+        async def pull_many():
+            # pylint: disable=protected-access
+            session = self.query_tool._get_aio_session()
+
+            await self.query_tool.pull_many(["example.org"])
+
+            self.assertIs(session, self.query_tool._aio_session)
+            self.assertFalse(session.closed)
+
+        self.run_with_server(handler, pull_many)
+
+    def test_get_urls(self) -> None:
+        """
+        Tests the method which provides the URLs to communicate with.
+        """
+
+        # pylint: disable=protected-access
+
+        self.query_tool.url_base = "https://example.org"
+
+        self.query_tool.is_modern_api = False
+        self.query_tool.token = ""
+
+        expected = "https://example.org/v1/subject/search"
+        actual = self.query_tool._get_urls()["pull"]
+
+        self.assertEqual(expected, actual)
+
+        self.query_tool.is_modern_api = True
+
+        expected = "https://example.org/v1/hub/aggregation/subject/search"
+        actual = self.query_tool._get_urls()["pull"]
+
+        self.assertEqual(expected, actual)
+
+        self.query_tool.token = secrets.token_urlsafe(6)
+
+        expected = "https://example.org/v1/aggregation/subject/search"
+        actual = self.query_tool._get_urls()["pull"]
+
+        self.assertEqual(expected, actual)
+
+        self.query_tool.url_base = "https://example.com"
+
+        expected = "https://example.com/v1/aggregation/subject/search"
+        actual = self.query_tool._get_urls()["pull"]
+
+        self.assertEqual(expected, actual)
+
+    @unittest.mock.patch.object(requests.Session, "post")
+    def test_push(self, request_mock) -> None:
+        """
+        Tests the method which let us push some dataset into the platform.
+        """
+
+        response_dict = self.response_dataset
+        response_dict["subject"] = "example.net"
+
+        def mocking(*args, **kwargs):  # pylint: disable=unused-argument
+            response_content = json.dumps(response_dict)
+
+            response = requests.models.Response()
+            response.url = "https://example.org/v1/status/availability"
+            response.status_code = 200
+
+            response.raw = io.BytesIO(str.encode(response_content))
+
+            response.history = [response]
+
+            return response
+
+        self.query_tool.url_base = "https://example.org"
+        self.query_tool.token = secrets.token_urlsafe(6)
+
+        request_mock.side_effect = mocking
+
+        expected = response_dict
+        actual = self.query_tool.push(
+            AvailabilityCheckerStatus(**self.availability_status_dataset)
+        )
+
+        self.assertEqual(expected, actual)
+
+    @unittest.mock.patch.object(requests.Session, "post")
+    def test_pull_guess_subject_not_found(self, request_mock) -> None:
+        """
+        Tests the method which let us pull the subject from the platform.
+
+        In this test case we check that the API flavor is guessed from a first
+        search of an unknown subject - without trying the legacy API.
+        """
+
+        def mocking(url, *args, **kwargs):  # pylint: disable=unused-argument
+            response = requests.models.Response()
+            response.url = url
+            response.status_code = 404
+            response.raw = io.BytesIO(b'{"detail": "Invalid subject."}')
+
+            response.history = [response]
+
+            return response
+
+        self.query_tool.url_base = "https://example.org"
+        self.query_tool.token = secrets.token_urlsafe(6)
+        request_mock.side_effect = mocking
+
+        with unittest.mock.patch.object(requests.Session, "get") as probe_mock:
+            actual = self.query_tool.pull("example.net")
+
+            probe_mock.assert_not_called()
+
+        self.assertIsNone(actual)
+        self.assertTrue(self.query_tool.is_modern_api)
+        self.assertEqual(
+            ["https://example.org/v1/aggregation/subject/search"],
+            [x[0][0] for x in request_mock.call_args_list],
+        )
+
+    @unittest.mock.patch.object(requests.Session, "post")
+    def test_push_guess_legacy_api(self, request_mock) -> None:
+        """
+        Tests the method which let us push some dataset into the platform.
+
+        In this test case we check that the API flavor is guessed from the
+        first submission - and that the WHOIS data are submitted to the legacy
+        API afterwards.
+        """
+
+        def mocking(url, *args, **kwargs):  # pylint: disable=unused-argument
+            response = requests.models.Response()
+            response.url = url
+
+            if "contracts" in url:
+                response.status_code = 404
+                response.raw = io.BytesIO(b'{"detail": "Not Found"}')
+            else:
+                response.status_code = 200
+                response.raw = io.BytesIO(str.encode(json.dumps(self.status_dataset)))
+
+            response.history = [response]
+
+            return response
+
+        self.query_tool.url_base = "https://example.org"
+        self.query_tool.token = secrets.token_urlsafe(6)
+        request_mock.side_effect = mocking
+
+        status = AvailabilityCheckerStatus(**self.availability_status_dataset)
+        status.expiration_date = "2021-03-09T17:42:15.771647"
+
+        expected = self.status_dataset
+
+        with unittest.mock.patch.object(requests.Session, "get") as probe_mock:
+            actual = self.query_tool.push(status)
+
+            probe_mock.assert_not_called()
+
+        self.assertEqual(expected, actual)
+        self.assertFalse(self.query_tool.is_modern_api)
+        self.assertEqual(
+            [
+                "https://example.org/v1/contracts/self-delivery",
+                "https://example.org/v1/status/availability",
+                "https://example.org/v1/status/whois",
+            ],
+            [x[0][0] for x in request_mock.call_args_list],
+        )
+
+    @unittest.mock.patch.object(requests.Session, "post")
+    def test_push_no_json_response(self, request_mock) -> None:
+        """
+        Tests the method which let us push some dataset into the platform.
+
+        In this test case, we test the case that the response is not JSON
+        encoded.
+        """
+
+        response_dict = self.response_dataset
+        response_dict["subject"] = "example.net"
+
+        def mocking(*args, **kwargs):  # pylint: disable=unused-argument
+            response_content = "I'm a teapot."
+
+            response = requests.models.Response()
+            response.url = "https://example.org/v1/status/availability"
+            response.status_code = 418
+
+            response.raw = io.BytesIO(str.encode(response_content))
+
+            response.history = [response]
+
+            return response
+
+        self.query_tool.url_base = "https://example.org"
+        request_mock.side_effect = mocking
+
+        expected = None
+        actual = self.query_tool.push(
+            AvailabilityCheckerStatus(**self.availability_status_dataset)
+        )
+
+        self.assertEqual(expected, actual)
+
+    @unittest.mock.patch.object(requests.Session, "post")
+    def test_push_with_whois(self, request_mock) -> None:
+        """
+        Tests the method which let us push some dataset into the platform.
+        """
+
+        response_dict = self.response_dataset
+        response_dict["subject"] = "example.net"
+        self.availability_status_dataset["expiration_date"] = "23-nov-2090"
+
+        def mocking(*args, **kwargs):  # pylint: disable=unused-argument
+            response_content = json.dumps(response_dict)
+
+            response = requests.models.Response()
+            response.url = "https://example.org/v1/status/availability"
+            response.status_code = 200
+
+            response.raw = io.BytesIO(str.encode(response_content))
+
+            response.history = [response]
+
+            return response
+
+        self.query_tool.url_base = "https://example.org"
+        self.query_tool.token = secrets.token_urlsafe(6)
+        request_mock.side_effect = mocking
+
+        expected = response_dict
+        actual = self.query_tool.push(
+            AvailabilityCheckerStatus(**self.availability_status_dataset)
+        )
+
+        self.assertEqual(expected, actual)
+
+    @unittest.mock.patch.object(requests.Session, "post")
+    def test_push_with_whois_no_json_response(self, request_mock) -> None:
+        """
+        Tests the method which let us push some dataset into the platform.
+        """
+
+        response_dict = self.response_dataset
+        response_dict["subject"] = "example.net"
+        self.availability_status_dataset["expiration_date"] = "23-nov-2090"
+
+        def mocking(*args, **kwargs):  # pylint: disable=unused-argument
+            response_content = "I'm a teapot."
+
+            response = requests.models.Response()
+            response.url = "https://example.org/v1/status/availability"
+            response.status_code = 418
+
+            response.raw = io.BytesIO(str.encode(response_content))
+
+            response.history = [response]
+
+            return response
+
+        self.query_tool.url_base = "https://example.org"
+        self.query_tool.token = secrets.token_urlsafe(6)
+        request_mock.side_effect = mocking
+
+        expected = None
+        actual = self.query_tool.push(
+            AvailabilityCheckerStatus(**self.availability_status_dataset)
+        )
+
+        self.assertEqual(expected, actual)
+
+    def test_push_with_whois_token_not_given(self) -> None:
+        """
+        Tests the method which let us push some dataset into the platform.
+
+        In this test, we test the case that no token is given.
+        """
+
+        response_dict = self.response_dataset
+        response_dict["subject"] = "example.net"
+        self.availability_status_dataset["expiration_date"] = "23-nov-2090"
+
+        if "PYFUNCEBLE_COLLECTION_API_TOKEN" in os.environ:
+            del os.environ["PYFUNCEBLE_COLLECTION_API_TOKEN"]
+
+        if "PYFUNCEBLE_PLATFORM_API_TOKEN" in os.environ:
+            del os.environ["PYFUNCEBLE_PLATFORM_API_TOKEN"]
+
+        self.query_tool.token = ""
+
+        expected = None
+        actual = self.query_tool.push(
+            AvailabilityCheckerStatus(**self.availability_status_dataset)
+        )
+
+        self.assertEqual(expected, actual)
+
+    def test_push_subject_not_str(self) -> None:
+        """
+        Tests the method which let us push some dataset into the platform.
+
+        In this test, we test the case that the given subject is not a string.
+        """
+
+        self.availability_status_dataset["subject"] = 293
 
         self.assertRaises(
             TypeError,
@@ -1207,8 +2687,13 @@ class TestPlatformQueryTool(unittest.TestCase):
         self.query_tool.token = ""
 
         expected = None
-        actual = self.query_tool.push(
-            AvailabilityCheckerStatus(**self.availability_status_dataset)
-        )
+
+        with unittest.mock.patch.object(
+            AvailabilityCheckerStatus, "to_json"
+        ) as to_json_mock:
+            actual = self.query_tool.push(
+                AvailabilityCheckerStatus(**self.availability_status_dataset)
+            )
 
         self.assertEqual(expected, actual)
+        to_json_mock.assert_not_called()